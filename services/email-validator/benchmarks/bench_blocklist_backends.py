@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Compares the frozenset and packed (mmap) blocklist backends on memory per entry
+and suffix lookup latency, using a synthetic feed of a million domains or a
+text blocklist given with --feed.
+
+    ./benchmarks/bench_blocklist_backends.py [--entries 1000000] [--feed list.txt]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("VERIFY_MAIL_API_KEY", "benchmark")
+
+from blocklist import DomainSuffixIndex  # noqa: E402
+from packed_domains import build, read_domains_file  # noqa: E402
+
+
+def synthetic_feed(size: int) -> list[str]:
+    rng = random.Random(42)
+    tlds = ["com", "net", "org", "io", "xyz", "ru", "co.uk", "com.br"]
+    alphabet = string.ascii_lowercase + string.digits
+    return [
+        "".join(rng.choices(alphabet, k=rng.randint(5, 14))) + "." + rng.choice(tlds)
+        for _ in range(size)
+    ]
+
+
+def measure_allocations(fn):
+    tracemalloc.start()
+    result = fn()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, allocated
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--feed", help="Text blocklist, one domain per line")
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    if args.feed:
+        domains, _ = read_domains_file(args.feed)
+    else:
+        domains = synthetic_feed(args.entries)
+    entries = len(set(domains))
+
+    rng = random.Random(7)
+    sample = rng.sample(domains, min(args.lookups // 2, len(domains)))
+    lookups = [f"mail.{domain}" for domain in sample[: len(sample) // 2]]
+    lookups += sample[len(sample) // 2 :]
+    lookups += [f"company{index}.example.com" for index in range(len(sample))]
+    rng.shuffle(lookups)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "domains.bin")
+        build(domains, path)
+        file_size = os.path.getsize(path)
+
+        backends = {
+            "frozenset": measure_allocations(
+                lambda: DomainSuffixIndex.from_domains(domains)
+            ),
+            "packed": measure_allocations(lambda: DomainSuffixIndex.from_file(path)),
+        }
+
+        print(f"{entries} entries, {len(lookups)} lookups")
+        for name, (index, allocated) in backends.items():
+            best = min(
+                timeit.repeat(
+                    lambda: [index.match(domain) for domain in lookups],
+                    number=1,
+                    repeat=3,
+                )
+            )
+            matches = sum(1 for domain in lookups if index.match(domain) is not None)
+            print(
+                f"{name:>9}: {allocated / entries:6.1f} B/entry heap | "
+                f"{best / len(lookups) * 1e6:6.2f} us/lookup | {matches} matches"
+            )
+        print(
+            f"   packed: {file_size / entries:6.1f} B/entry mmap'ed, shared by all workers"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Replays key streams through the verdict cache with the LRU and W-TinyLFU
+policies, and compares their hit ratio and time per access. The synthetic
+streams are a Zipf distribution of domains, the same mixed with one-off random
+domains like a bot flood, and a loop slightly larger than the cache. Recorded
+streams, one domain or email per line, can be given with --trace.
+
+    ./benchmarks/bench_cache_policy.py [--size 10000] [--trace domains.log ...]
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("VERIFY_MAIL_API_KEY", "benchmark")
+
+from cache import MISSING, POLICIES, VerdictCache  # noqa: E402
+
+
+def zipf_stream(rng: random.Random, keys: int, accesses: int, s: float) -> list[str]:
+    domains = [f"domain{index}.com" for index in range(keys)]
+    weights = list(itertools.accumulate(1 / rank**s for rank in range(1, keys + 1)))
+    return rng.choices(domains, cum_weights=weights, k=accesses)
+
+
+def flood_stream(rng: random.Random, stream: list[str], share: float) -> list[str]:
+    flooded = []
+    for index, domain in enumerate(stream):
+        flooded.append(domain)
+        if rng.random() < share / (1 - share):
+            flooded.append(f"bot{index}-{rng.getrandbits(32):x}.com")
+    return flooded
+
+
+def loop_stream(keys: int, accesses: int) -> list[str]:
+    return [f"domain{index % keys}.com" for index in range(accesses)]
+
+
+def read_trace(path: str) -> list[str]:
+    with open(path) as f:
+        return [line.strip().rpartition("@")[2].lower() for line in f if line.strip()]
+
+
+def replay(stream: list[str], size: int, policy: str) -> tuple[float, float]:
+    cache = VerdictCache(
+        maxsize=size,
+        positive_ttl=3600,
+        negative_ttl=3600,
+        error_ttl=30,
+        policy=policy,
+    )
+    hits = 0
+    started_at = time.perf_counter()
+    for domain in stream:
+        if cache.get(domain) is MISSING:
+            cache.set(domain, True)
+        else:
+            hits += 1
+    elapsed = time.perf_counter() - started_at
+    return hits / len(stream), elapsed / len(stream)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10_000, help="Cache entries")
+    parser.add_argument("--keys", type=int, default=200_000)
+    parser.add_argument("--accesses", type=int, default=500_000)
+    parser.add_argument("--zipf", type=float, default=0.9)
+    parser.add_argument("--flood", type=float, default=0.5, help="Share of bot keys")
+    parser.add_argument("--trace", nargs="*", default=[], help="Recorded streams")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    zipf = zipf_stream(rng, args.keys, args.accesses, args.zipf)
+    streams = {
+        f"zipf {args.zipf}": zipf,
+        f"zipf + {args.flood:.0%} flood": flood_stream(rng, zipf, args.flood),
+        "loop": loop_stream(int(args.size * 1.5), args.accesses),
+    }
+    for path in args.trace:
+        streams[os.path.basename(path)] = read_trace(path)
+
+    print(f"{args.size} entries")
+    for name, stream in streams.items():
+        results = " | ".join(
+            f"{policy} {hit_ratio:6.2%} {per_access * 1e6:5.2f} us"
+            for policy in POLICIES
+            for hit_ratio, per_access in [replay(stream, args.size, policy)]
+        )
+        print(f"{name:>20} ({len(stream)} accesses): {results}")
+
+
+if __name__ == "__main__":
+    main()
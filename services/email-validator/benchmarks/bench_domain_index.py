@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Compares the exact `banned_domains` set lookup with DomainSuffixIndex.match.
+
+The default traffic is synthetic: mostly business domains of one to four
+labels, some banned domains and some subdomains of banned domains. Pass a file
+with one domain per line to replay recorded traffic instead.
+
+    ./benchmarks/bench_domain_index.py [--traffic domains.txt]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("VERIFY_MAIL_API_KEY", "benchmark")
+
+from blocklist import DomainSuffixIndex  # noqa: E402
+from validator import banned_domains  # noqa: E402
+
+
+def synthetic_traffic(size: int) -> list[str]:
+    rng = random.Random(42)
+    banned = sorted(banned_domains)
+    tlds = ["com", "io", "de", "co.uk", "com.au", "net"]
+    traffic = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < 0.08:
+            traffic.append(rng.choice(banned))
+        elif roll < 0.10:
+            traffic.append(f"mail{rng.randint(0, 9)}.{rng.choice(banned)}")
+        else:
+            company = f"company{rng.randint(0, 5000)}"
+            prefix = rng.choice(["", "", "eu.", "mail.", "corp.mail."])
+            traffic.append(f"{prefix}{company}.{rng.choice(tlds)}")
+    return traffic
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--traffic", help="File with one domain per line")
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.traffic:
+        with open(args.traffic) as f:
+            traffic = [line.strip().lower() for line in f if line.strip()]
+    else:
+        traffic = synthetic_traffic(args.size)
+
+    index = DomainSuffixIndex.from_domains(banned_domains)
+    exact = frozenset(banned_domains)
+
+    def run_exact():
+        return sum(1 for domain in traffic if domain in exact)
+
+    def run_suffix():
+        return sum(1 for domain in traffic if index.match(domain) is not None)
+
+    print(f"{len(traffic)} lookups against {len(index)} banned domains")
+    for name, fn in (("exact set", run_exact), ("suffix index", run_suffix)):
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(
+            f"{name:>12}: {best / len(traffic) * 1e9:8.1f} ns/lookup | {fn()} matches"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Compares the latency of is_valid_syntax and the email_regex it replaces on
+typical addresses and on crafted local parts that make the regex backtrack.
+tests/test_syntax.py checks that both give the same verdicts.
+
+    ./benchmarks/bench_email_syntax.py [--max-crafted-length 24]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from syntax import email_regex, is_valid_syntax  # noqa: E402
+
+_TYPICAL = [
+    "john.doe@example.com",
+    "jane_doe+newsletter@mail.example.co.uk",
+    "ADMIN@EXAMPLE.ORG",
+    "no-at-sign.example.com",
+    "a..b@example.com",
+    "first.last@sub-domain.example.io",
+]
+
+
+def regex_is_valid(email: str) -> bool:
+    return bool(re.fullmatch(email_regex, email))
+
+
+def per_call(fn, emails: list[str], number: int) -> float:
+    return (
+        min(timeit.repeat(lambda: [fn(email) for email in emails], number=number))
+        / number
+        / len(emails)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-crafted-length", type=int, default=24)
+    args = parser.parse_args()
+
+    for name, fn in (("regex", regex_is_valid), ("single pass", is_valid_syntax)):
+        print(
+            f"{name:>11}: {per_call(fn, _TYPICAL, 20000) * 1e6:6.2f} us/typical email"
+        )
+
+    print("Crafted local parts, '1' * n + '!@example.com':")
+    for length in range(16, args.max_crafted_length + 1, 2):
+        email = "1" * length + "!@example.com"
+        timings = []
+        for fn in (regex_is_valid, is_valid_syntax):
+            started_at = time.perf_counter()
+            fn(email)
+            timings.append(time.perf_counter() - started_at)
+        print(
+            f"  n={length:>3} regex: {timings[0] * 1e3:10.3f} ms | "
+            f"single pass: {timings[1] * 1e3:.4f} ms"
+        )
+
+    email = "1" * 100_000 + "!@example.com"
+    started_at = time.perf_counter()
+    is_valid_syntax(email)
+    print(f"  n=100000 single pass: {(time.perf_counter() - started_at) * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Compares per-request overhead of the request middleware against the two
+@app.middleware("http") functions it replaces, and against no middleware.
+Requests are driven straight through the ASGI app in-process, so only the
+framework and middleware cost is measured, not the network or a server.
+
+    ./benchmarks/bench_middleware.py [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("VERIFY_MAIL_API_KEY", "benchmark")
+
+import fastapi  # noqa: E402
+
+from middleware import RequestMiddleware  # noqa: E402
+
+_TRACEPARENT = b"00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+def _build_app(variant: str) -> fastapi.FastAPI:
+    app = fastapi.FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if variant == "base_http":
+
+        @app.middleware("http")
+        async def timeit(request: fastapi.Request, call_next):
+            started_at = time.perf_counter()
+            response = await call_next(request)
+            response.headers["X-Process-Time"] = str(time.perf_counter() - started_at)
+            return response
+
+        @app.middleware("http")
+        async def propagate_traceparent(request: fastapi.Request, call_next):
+            request.state.span = request.headers.get("traceparent")
+            return await call_next(request)
+
+    elif variant == "asgi":
+        app.add_middleware(RequestMiddleware)
+
+    return app
+
+
+async def _request(app):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost"), (b"traceparent", _TRACEPARENT)],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 80),
+    }
+
+    messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+    async def receive():
+        return next(messages, {"type": "http.disconnect"})
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def measure(variant: str, requests: int) -> float:
+    app = _build_app(variant)
+    for _ in range(1000):
+        await _request(app)
+
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        await _request(app)
+    return requests / (time.perf_counter() - started_at)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    baseline = None
+    for variant in ("none", "base_http", "asgi"):
+        rps = asyncio.run(measure(variant, args.requests))
+        baseline = baseline or rps
+        print(
+            f"{variant:>9}: {rps:8.0f} req/s | "
+            f"{(1 / rps - 1 / baseline) * 1e6:6.1f} us/request overhead"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Checks the preserialized /validate responses render the same bytes as the
+JSONResponse they replace, then compares the CPU spent per request decoding
+the body and building the response.
+
+    ./benchmarks/bench_payloads.py [--number 100000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fastapi  # noqa: E402
+import orjson  # noqa: E402
+
+from payloads import error_content, validation_response  # noqa: E402
+
+_CASES = [
+    (True, "john.doe@example.com", False),
+    (False, "jane@mailinator.com", False),
+    (False, "jöhn@exämple.de", True),
+    (True, "first.last@example.io", True),
+]
+
+
+def json_response(valid: bool, email, degraded: bool) -> fastapi.Response:
+    if valid:
+        content = {"valid": True, "msg": "All good."}
+        status_code = 200
+    else:
+        content = error_content(email)
+        status_code = 400
+
+    if degraded:
+        content["degraded"] = True
+
+    return fastapi.responses.JSONResponse(content=content, status_code=status_code)
+
+
+def stdlib_path(body: bytes, valid: bool, degraded: bool):
+    email = json.loads(body).get("email")
+    return json_response(valid, email, degraded)
+
+
+def preserialized_path(body: bytes, valid: bool, degraded: bool):
+    email = orjson.loads(body).get("email")
+    return validation_response(valid, email, degraded)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    requests = [
+        (json.dumps({"email": email}).encode(), valid, degraded)
+        for valid, email, degraded in _CASES
+    ]
+    for body, valid, degraded in requests:
+        old = stdlib_path(body, valid, degraded)
+        new = preserialized_path(body, valid, degraded)
+        assert (old.body, old.status_code, old.headers.items()) == (
+            new.body,
+            new.status_code,
+            new.headers.items(),
+        ), (old.body, new.body)
+    print(f"{len(requests)} response shapes render identical bytes")
+
+    timings = {}
+    for name, fn in (("stdlib", stdlib_path), ("preserialized", preserialized_path)):
+        timings[name] = min(
+            timeit.repeat(
+                lambda: [fn(*request) for request in requests],
+                number=args.number // len(requests),
+                repeat=5,
+            )
+        ) / (args.number // len(requests) * len(requests))
+        print(f"{name:>13}: {timings[name] * 1e6:6.2f} us/request")
+
+    saved = timings["stdlib"] - timings["preserialized"]
+    print(f"saved {saved * 1e6:.2f} us/request ({saved / timings['stdlib']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Measures how long importing the app takes and the resulting RSS, with tracing
+on and off. Each run is a fresh interpreter, so nothing is cached in-process.
+
+    ./benchmarks/bench_startup.py [--runs 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+_SERVICE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+_PROBE = """
+import resource, sys, time
+started_at = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started_at
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(sys.modules))
+"""
+
+
+def measure(tracing_enabled: bool, runs: int) -> tuple[list[float], list[int], int]:
+    env = {
+        **os.environ,
+        "VERIFY_MAIL_API_KEY": os.environ.get("VERIFY_MAIL_API_KEY", "benchmark"),
+        "TRACING_ENABLED": str(tracing_enabled).lower(),
+    }
+    import_times, rss_kb, modules = [], [], 0
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE],
+            cwd=_SERVICE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        import_times.append(float(output[-3]))
+        rss_kb.append(int(output[-2]))
+        modules = int(output[-1])
+    return import_times, rss_kb, modules
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for tracing_enabled in (False, True):
+        import_times, rss_kb, modules = measure(tracing_enabled, args.runs)
+        print(
+            f"tracing {'on ' if tracing_enabled else 'off'}: "
+            f"import {statistics.median(import_times) * 1000:7.1f} ms median | "
+            f"max RSS {statistics.median(rss_kb) / 1024:6.1f} MiB | "
+            f"{modules} modules"
+        )
+
+
+if __name__ == "__main__":
+    main()
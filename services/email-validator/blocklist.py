@@ -0,0 +1,140 @@
+import asyncio
+import os
+import signal
+from typing import Container, Iterable
+
+from logger import get_logger
+from packed_domains import (
+    PackedDomainSet,
+    is_packed_file,
+    normalize_domain,
+    read_domains_file,
+)
+from settings import conf
+
+logger = get_logger(__name__, conf.LOG_LEVEL)
+
+
+class DomainSuffixIndex:
+    # Matches a domain and every parent domain against the registered entries,
+    # so banning "163.com" bans "mail.163.com" too. A lookup is one set probe
+    # per label of the looked up domain, against a frozenset or, for feeds too
+    # large to hold as Python strings, a PackedDomainSet.
+    def __init__(self, domains: Container[str], version: str = ""):
+        self.version = version
+        self._domains = domains
+
+    @classmethod
+    def from_domains(cls, domains: Iterable[str], version: str = ""):
+        normalized = (normalize_domain(domain) for domain in domains)
+        return cls(frozenset(domain for domain in normalized if domain), version)
+
+    @classmethod
+    def from_file(cls, path: str):
+        if is_packed_file(path):
+            domains = PackedDomainSet(path)
+            return cls(domains, version=domains.version)
+
+        domains, version = read_domains_file(path)
+        return cls.from_domains(domains, version=version)
+
+    def __len__(self):
+        return len(self._domains)
+
+    def __iter__(self):
+        return iter(self._domains)
+
+    def __contains__(self, domain: str) -> bool:
+        return self.match(domain) is not None
+
+    def match(self, domain: str) -> str | None:
+        domains = self._domains
+        while True:
+            if domain in domains:
+                return domain
+
+            _, dot, domain = domain.partition(".")
+            if not dot:
+                return None
+
+
+class ReloadableBlocklist:
+    # Holds the index built from the banned domains file. A reload builds the
+    # new index completely before replacing the reference to the old one, so
+    # in-flight lookups see either the old list or the new one, never a mix.
+    def __init__(self, path: str, reload_interval: float):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.index = self._build()
+        self._mtime = self._get_mtime()
+        self._reload_lock = asyncio.Lock()
+        self._watch_task: asyncio.Task | None = None
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __contains__(self, domain: str) -> bool:
+        return self.index.match(domain) is not None
+
+    @property
+    def version(self) -> str:
+        return self.index.version
+
+    def match(self, domain: str) -> str | None:
+        return self.index.match(domain)
+
+    def _get_mtime(self) -> float:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return 0.0
+
+    def _build(self) -> DomainSuffixIndex:
+        return DomainSuffixIndex.from_file(self.path)
+
+    async def reload(self):
+        async with self._reload_lock:
+            mtime = self._get_mtime()
+            try:
+                index = await asyncio.to_thread(self._build)
+            except (OSError, ValueError) as e:
+                # The old list stays in use, the watcher retries once the file
+                # changes again instead of on every poll
+                self._mtime = mtime
+                logger.error(f"Failed reloading banned domains from {self.path}: {e!r}")
+                return
+
+            self.index, self._mtime = index, mtime
+            logger.info(f"Loaded {len(index)} banned domains, version {index.version}")
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            if self._get_mtime() != self._mtime:
+                await self.reload()
+
+    def start_watching(self):
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(
+                signal.SIGHUP, lambda: asyncio.ensure_future(self.reload())
+            )
+        except (NotImplementedError, AttributeError, RuntimeError, ValueError):
+            logger.warning("SIGHUP reload of banned domains is not supported here")
+
+        if self.reload_interval > 0:
+            self._watch_task = asyncio.create_task(self._watch())
+
+    async def stop_watching(self):
+        try:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        except (NotImplementedError, AttributeError, RuntimeError, ValueError):
+            pass
+
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            await asyncio.gather(self._watch_task, return_exceptions=True)
+            self._watch_task = None
@@ -0,0 +1,125 @@
+import collections
+import enum
+import time
+from typing import Callable
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    # Closed: calls go through and their outcomes are kept for `window` seconds,
+    # the circuit opens once at least `min_calls` were seen and either the error
+    # rate or the slow call rate reaches its threshold.
+    # Open: calls are rejected for `open_duration` seconds.
+    # Half open: up to `half_open_calls` probes go through, the circuit closes
+    # once they all succeed in time and opens again on the first bad one.
+    def __init__(
+        self,
+        window: float,
+        min_calls: int,
+        error_rate: float,
+        slow_call_duration: float,
+        slow_call_rate: float,
+        open_duration: float,
+        half_open_calls: int,
+        on_state_change: Callable[[CircuitState], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self._on_state_change = on_state_change
+        self._clock = clock
+
+        self.state = CircuitState.CLOSED
+        self._outcomes: collections.deque[tuple[float, bool, bool]] = (
+            collections.deque()
+        )
+        self._failures = 0
+        self._slow_calls = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    def _transition(self, state: CircuitState):
+        self.state = state
+        self._outcomes.clear()
+        self._failures = self._slow_calls = 0
+        self._probes_in_flight = self._probe_successes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+
+        if self._on_state_change is not None:
+            self._on_state_change(state)
+
+    def allow(self) -> bool:
+        if self.state == CircuitState.OPEN:
+            if self._clock() - self._opened_at < self.open_duration:
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_calls:
+                return False
+            self._probes_in_flight += 1
+
+        return True
+
+    def release(self):
+        # For a call that was allowed but abandoned before it had an outcome
+        if self.state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def record_unanswered(self, duration: float):
+        # For a call cut short after `duration` without a response: it's slow
+        # once that's past slow_call_duration, before that it says nothing
+        if duration >= self.slow_call_duration:
+            self.record(duration, failed=False)
+        else:
+            self.release()
+
+    def record(self, duration: float, failed: bool):
+        slow = duration >= self.slow_call_duration
+
+        if self.state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+            if failed or slow:
+                self._transition(CircuitState.OPEN)
+                return
+
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self.state == CircuitState.OPEN:
+            # A call started before the circuit opened
+            return
+
+        now = self._clock()
+        self._outcomes.append((now, failed, slow))
+        self._failures += failed
+        self._slow_calls += slow
+        while self._outcomes and self._outcomes[0][0] <= now - self.window:
+            _, old_failed, old_slow = self._outcomes.popleft()
+            self._failures -= old_failed
+            self._slow_calls -= old_slow
+
+        calls = len(self._outcomes)
+        if calls >= self.min_calls and (
+            self._failures / calls >= self.error_rate
+            or self._slow_calls / calls >= self.slow_call_rate
+        ):
+            self._transition(CircuitState.OPEN)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+"""
+Offline bulk validation of exported email lists.
+
+Runs the syntax and banned domains checks across all cores and writes the input
+back with `valid` and `reason` columns appended. Only emails passing the local
+checks can be sent to Verify Mail, once per unique domain, with --upstream.
+Like the server, emails Verify Mail has no verdict for fall back to the legacy
+syntax rules, all of them do without --upstream.
+
+    ./bulk.py contacts.csv contacts.validated.csv
+    ./bulk.py contacts.parquet contacts.validated.parquet --upstream
+
+Parquet files need the packages listed in requirements-bulk.txt.
+"""
+
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import csv
+import os
+import sys
+import time
+
+from canonical import CanonicalEmail
+from http_client import close_http_client
+from ratelimit import Priority, priority
+from settings import conf
+from syntax import is_valid_syntax
+from validator import (
+    banned_domains,
+    canonicalize_email,
+    is_well_formed,
+    shared_verdict_cache,
+    verdict_cache,
+    verdict_store,
+    verify_domain,
+)
+
+REASON_SYNTAX = "syntax"
+REASON_BANNED_DOMAIN = "banned_domain"
+REASON_DISPOSABLE = "disposable"
+REASON_UNVERIFIED = "unverified"
+REASON_OK = "ok"
+
+_valid_reasons = {REASON_UNVERIFIED, REASON_OK}
+
+
+def _check_chunk(emails: list, fallback: bool) -> list[str]:
+    # The structural syntax check of the server's syntax stage, the legacy
+    # rules only decide rows no upstream verdict is coming for
+    reasons = []
+    for email in map(canonicalize_email, emails):
+        if not email or not is_well_formed(email):
+            reasons.append(REASON_SYNTAX)
+        elif banned_domains.match(email.domain) is not None:
+            reasons.append(REASON_BANNED_DOMAIN)
+        elif fallback and not is_valid_syntax(email.address):
+            reasons.append(REASON_SYNTAX)
+        else:
+            reasons.append(REASON_UNVERIFIED)
+    return reasons
+
+
+async def _verify_unverified(emails: list, reasons: list[str]):
+    # Only one email per domain is sent, the verdict cache answers the rest
+    # and every later chunk containing the same domain
+    canonical_emails = [
+        canonicalize_email(email) if reason == REASON_UNVERIFIED else None
+        for email, reason in zip(emails, reasons)
+    ]
+    first_email_by_domain = {}
+    for email in canonical_emails:
+        if email is not None:
+            first_email_by_domain.setdefault(email.domain, email)
+
+    semaphore = asyncio.Semaphore(conf.BATCH_UPSTREAM_CONCURRENCY)
+
+    async def verify(email: CanonicalEmail):
+        async with semaphore:
+            return await verify_domain(email)
+
+    with priority(Priority.BATCH):
+        results = await asyncio.gather(
+            *(verify(email) for email in first_email_by_domain.values())
+        )
+    verdict_by_domain = dict(zip(first_email_by_domain, results))
+
+    for index, email in enumerate(canonical_emails):
+        if email is None:
+            continue
+
+        verdict = verdict_by_domain[email.domain]
+        if verdict is not None:
+            reasons[index] = REASON_OK if verdict else REASON_DISPOSABLE
+        elif not is_valid_syntax(email.address):
+            reasons[index] = REASON_SYNTAX
+
+
+class _CSVFile:
+    def __init__(self, input_path: str, output_path: str, column: str):
+        self.column = column
+        self._input = open(input_path, newline="")
+        self._output = open(output_path, "w", newline="")
+        self._reader = csv.DictReader(self._input)
+        if column not in (self._reader.fieldnames or []):
+            raise SystemExit(f"Column {column!r} not found in {input_path}")
+
+        self._writer = csv.DictWriter(
+            self._output, fieldnames=[*self._reader.fieldnames, "valid", "reason"]
+        )
+        self._writer.writeheader()
+
+    def chunks(self, chunk_size: int):
+        while True:
+            rows = [row for _, row in zip(range(chunk_size), self._reader)]
+            if not rows:
+                return
+            yield rows
+
+    def emails(self, rows: list[dict]) -> list:
+        return [row[self.column] for row in rows]
+
+    def write(self, rows: list[dict], reasons: list[str]):
+        for row, reason in zip(rows, reasons):
+            row["valid"] = reason in _valid_reasons
+            row["reason"] = reason
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._input.close()
+        self._output.close()
+
+
+class _ParquetFile:
+    def __init__(self, input_path: str, output_path: str, column: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Parquet files need pyarrow, see requirements-bulk.txt")
+
+        self.column = column
+        self._pyarrow = pyarrow
+        self._input = pyarrow.parquet.ParquetFile(input_path)
+        if column not in self._input.schema_arrow.names:
+            raise SystemExit(f"Column {column!r} not found in {input_path}")
+
+        schema = self._input.schema_arrow.append(
+            pyarrow.field("valid", pyarrow.bool_())
+        ).append(pyarrow.field("reason", pyarrow.string()))
+        self._writer = pyarrow.parquet.ParquetWriter(output_path, schema)
+
+    def chunks(self, chunk_size: int):
+        yield from self._input.iter_batches(batch_size=chunk_size)
+
+    def emails(self, batch) -> list:
+        return batch.column(self.column).to_pylist()
+
+    def write(self, batch, reasons: list[str]):
+        pyarrow = self._pyarrow
+        batch = pyarrow.RecordBatch.from_arrays(
+            [
+                *batch.columns,
+                pyarrow.array([reason in _valid_reasons for reason in reasons]),
+                pyarrow.array(reasons),
+            ],
+            schema=self._writer.schema,
+        )
+        self._writer.write_batch(batch)
+
+    def close(self):
+        self._writer.close()
+
+
+def _open_files(input_path: str, output_path: str, column: str):
+    formats = {path.endswith(".parquet") for path in (input_path, output_path)}
+    if len(formats) != 1:
+        raise SystemExit("Input and output files must have the same format")
+
+    if formats == {True}:
+        return _ParquetFile(input_path, output_path, column)
+    return _CSVFile(input_path, output_path, column)
+
+
+async def run(args) -> tuple[int, collections.Counter]:
+    files = _open_files(args.input, args.output, args.column)
+    loop = asyncio.get_running_loop()
+    rows_total = 0
+    reasons_total = collections.Counter()
+    started_at = time.perf_counter()
+
+    # Chunks are checked in worker processes while earlier ones are verified
+    # upstream and written, only a few chunks are ever held in memory
+    pending = collections.deque()
+
+    async def write_next():
+        nonlocal rows_total
+        chunk, emails, future = pending.popleft()
+        reasons = await future
+        if args.upstream:
+            await _verify_unverified(emails, reasons)
+
+        files.write(chunk, reasons)
+        rows_total += len(reasons)
+        reasons_total.update(reasons)
+        if not args.quiet:
+            elapsed = time.perf_counter() - started_at
+            print(
+                f"{rows_total} rows | {rows_total / elapsed:.0f} rows/s",
+                file=sys.stderr,
+            )
+
+    # Same verdict tiers as the server, verdicts stored by earlier runs or
+    # other instances save upstream calls
+    if args.upstream and verdict_store is not None:
+        await verdict_store.open(warm_cache=verdict_cache)
+
+    try:
+        with concurrent.futures.ProcessPoolExecutor(args.workers) as pool:
+            for chunk in files.chunks(args.chunk_size):
+                emails = files.emails(chunk)
+                future = loop.run_in_executor(
+                    pool, _check_chunk, emails, not args.upstream
+                )
+                pending.append((chunk, emails, future))
+                if len(pending) >= 2 * args.workers:
+                    await write_next()
+
+            while pending:
+                await write_next()
+    finally:
+        files.close()
+        if args.upstream and verdict_store is not None:
+            await verdict_store.close()
+        if shared_verdict_cache is not None:
+            await shared_verdict_cache.close()
+        await close_http_client()
+
+    return rows_total, reasons_total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate CSV or Parquet email lists")
+    parser.add_argument("input", help="CSV or .parquet file to validate")
+    parser.add_argument("output", help="Annotated file to write, same format as input")
+    parser.add_argument("--column", default="email", help="Column holding the emails")
+    parser.add_argument(
+        "--upstream",
+        action="store_true",
+        help="Send domains passing the local checks to Verify Mail",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--quiet", action="store_true", help="Only print the summary")
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    rows_total, reasons_total = asyncio.run(run(args))
+    elapsed = time.perf_counter() - started_at
+
+    print(
+        f"Validated {rows_total} rows in {elapsed:.2f}s | {rows_total / max(elapsed, 1e-9):.0f} rows/s"
+    )
+    for reason, count in reasons_total.most_common():
+        print(f"{reason}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+import asyncio
+import collections
+import contextvars
+import time
+from typing import Awaitable, Callable, Hashable
+
+from ratelimit import Priority, priority
+
+# Called with refresh=True when a cached verdict is refreshed in the background
+Loader = Callable[..., Awaitable[tuple["Verdict", float | None]]]
+
+MISSING = object()
+
+Verdict = bool | None
+
+
+class LRUPolicy:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def peek(self, key: Hashable):
+        return self._entries.get(key)
+
+    def set(self, key: Hashable, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class FrequencySketch:
+    # Count-min sketch of how often keys were seen, with 4 bit counters in
+    # 4 rows. All counters are halved every 10 * width increments, so keys
+    # that were popular a while ago age out.
+    _halve = bytes(value >> 1 for value in range(256))
+
+    def __init__(self, capacity: int):
+        width = 1 << max(capacity - 1, 1).bit_length()
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(4)]
+        self._additions = 0
+        self._sample_size = 10 * width
+
+    def _indexes(self, key: Hashable) -> tuple[int, int, int, int]:
+        # Row indexes are derived from the two halves of one hash()
+        key_hash = hash(key)
+        first = key_hash & 0xFFFFFFFF
+        second = key_hash >> 32 | 1
+        mask = self._mask
+        return (
+            first & mask,
+            (first + second) & mask,
+            (first + 2 * second) & mask,
+            (first + 3 * second) & mask,
+        )
+
+    def frequency(self, key: Hashable) -> int:
+        first, second, third, fourth = self._indexes(key)
+        rows = self._rows
+        return min(rows[0][first], rows[1][second], rows[2][third], rows[3][fourth])
+
+    def increment(self, key: Hashable):
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._additions //= 2
+            self._rows = [row.translate(self._halve) for row in self._rows]
+
+
+class TinyLFUPolicy:
+    # W-TinyLFU: new keys enter a small LRU window. Keys leaving the window
+    # only get into the main segment when they were seen more often than the
+    # entry they would evict, so a burst of one-off keys (e.g. bots trying
+    # random domains) can't flush the popular ones. The main segment is split
+    # into probation and protected LRUs, a hit in probation promotes the key.
+    def __init__(
+        self,
+        maxsize: int,
+        window_fraction: float = 0.01,
+        protected_fraction: float = 0.8,
+    ):
+        self.maxsize = maxsize
+        self._window_size = max(int(maxsize * window_fraction), 1)
+        self._main_size = max(maxsize - self._window_size, 0)
+        self._protected_size = int(self._main_size * protected_fraction)
+        self._sketch = FrequencySketch(maxsize)
+        self._window: collections.OrderedDict = collections.OrderedDict()
+        self._probation: collections.OrderedDict = collections.OrderedDict()
+        self._protected: collections.OrderedDict = collections.OrderedDict()
+        self._segments: dict[Hashable, collections.OrderedDict] = {}
+
+    def __len__(self):
+        return len(self._segments)
+
+    def get(self, key: Hashable):
+        # Misses count too, a key needs some history to win admission
+        self._sketch.increment(key)
+        segment = self._segments.get(key)
+        if segment is None:
+            return None
+
+        if segment is not self._probation:
+            segment.move_to_end(key)
+            return segment[key]
+
+        value = self._probation.pop(key)
+        self._protected[key] = value
+        self._segments[key] = self._protected
+        if len(self._protected) > self._protected_size:
+            demoted, demoted_value = self._protected.popitem(last=False)
+            self._probation[demoted] = demoted_value
+            self._segments[demoted] = self._probation
+        return value
+
+    def peek(self, key: Hashable):
+        segment = self._segments.get(key)
+        return None if segment is None else segment[key]
+
+    def set(self, key: Hashable, value):
+        segment = self._segments.get(key)
+        if segment is not None:
+            segment[key] = value
+            return
+
+        self._window[key] = value
+        self._segments[key] = self._window
+        if len(self._window) > self._window_size:
+            self._admit(*self._window.popitem(last=False))
+
+    def _admit(self, candidate: Hashable, value):
+        if len(self._probation) + len(self._protected) < self._main_size:
+            self._probation[candidate] = value
+            self._segments[candidate] = self._probation
+            return
+
+        victims = self._probation or self._protected
+        victim = next(iter(victims), None)
+        if victim is None or (
+            self._sketch.frequency(candidate) <= self._sketch.frequency(victim)
+        ):
+            del self._segments[candidate]
+            return
+
+        del victims[victim]
+        del self._segments[victim]
+        self._probation[candidate] = value
+        self._segments[candidate] = self._probation
+
+    def pop(self, key: Hashable):
+        segment = self._segments.pop(key, None)
+        if segment is not None:
+            del segment[key]
+
+    def clear(self):
+        for segment in (self._window, self._probation, self._protected):
+            segment.clear()
+        self._segments.clear()
+
+
+POLICIES = {"lru": LRUPolicy, "tinylfu": TinyLFUPolicy}
+
+
+class VerdictCache:
+    # Verdicts are True (valid), False (rejected) or None (upstream error),
+    # each kind expires after its own TTL unless one is given per entry.
+    # Once `refresh_ahead` of its TTL has passed, a hit on a valid or rejected
+    # verdict reloads it in the background. Until that's done the old verdict
+    # is still served, for up to `stale_grace` seconds past its expiry.
+    def __init__(
+        self,
+        maxsize: int,
+        positive_ttl: float,
+        negative_ttl: float,
+        error_ttl: float,
+        refresh_ahead: float = 1.0,
+        stale_grace: float = 0.0,
+        policy: str = "lru",
+        clock: Callable[[], float] = time.monotonic,
+        on_refresh_error: Callable[[Hashable, BaseException], None] | None = None,
+    ):
+        self.maxsize = maxsize
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.error_ttl = error_ttl
+        self.refresh_ahead = refresh_ahead
+        self.stale_grace = stale_grace
+        self._clock = clock
+        self._on_refresh_error = on_refresh_error
+        # (verdict, refresh_at, expires_at)
+        self._entries: LRUPolicy | TinyLFUPolicy = POLICIES[policy](maxsize)
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, verdict: Verdict) -> float:
+        if verdict is None:
+            return self.error_ttl
+        return self.positive_ttl if verdict else self.negative_ttl
+
+    def _lookup(self, key: Hashable) -> tuple[Verdict, float, float] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        verdict, _, expires_at = entry
+        now = self._clock()
+        if expires_at <= now and (
+            verdict is None or expires_at + self.stale_grace <= now
+        ):
+            self._entries.pop(key)
+            return None
+        return entry
+
+    def get(self, key: Hashable):
+        entry = self._lookup(key)
+        if entry is None or entry[2] <= self._clock():
+            return MISSING
+        return entry[0]
+
+    def get_unless_due(self, key: Hashable):
+        # Like get(), but a verdict due for a refresh is MISSING too, so it's
+        # served by get_or_load, which schedules the refresh
+        entry = self._lookup(key)
+        if entry is None or entry[1] <= self._clock():
+            return MISSING
+        return entry[0]
+
+    def set(self, key: Hashable, verdict: Verdict, ttl: float | None = None):
+        ttl = self.ttl_for(verdict) if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            self._entries.pop(key)
+            return
+
+        now = self._clock()
+        refresh_at = (
+            now + ttl * self.refresh_ahead if verdict is not None else now + ttl
+        )
+        self._entries.set(key, (verdict, refresh_at, now + ttl))
+
+    def clear(self):
+        self._entries.clear()
+
+    async def get_or_load(self, key: Hashable, loader: Loader) -> Verdict:
+        entry = self._lookup(key)
+        if entry is not None:
+            verdict, refresh_at, _ = entry
+            if refresh_at <= self._clock():
+                self._refresh(key, loader)
+            return verdict
+
+        # Concurrent misses for the same key share a single upstream call
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    def _refresh(self, key: Hashable, loader: Loader):
+        if key in self._inflight:
+            return
+
+        # Refreshes outlive the request that triggered them, so they run in an
+        # empty context instead of inheriting its deadline
+        task = asyncio.get_running_loop().create_task(
+            self._load_in_background(key, loader), context=contextvars.Context()
+        )
+        task.add_done_callback(lambda task: self._refresh_done(key, task))
+        self._inflight[key] = task
+
+    def _refresh_done(self, key: Hashable, task: asyncio.Task):
+        # Nobody awaits a refresh, its errors would otherwise go unnoticed
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None and self._on_refresh_error is not None:
+            self._on_refresh_error(key, error)
+
+    async def _load_in_background(self, key: Hashable, loader: Loader):
+        # Nobody waits for a refresh, it queues behind interactive lookups
+        with priority(Priority.BATCH):
+            return await self._load(key, loader, refresh=True)
+
+    async def _load(self, key: Hashable, loader: Loader, refresh: bool = False):
+        try:
+            if not refresh:
+                verdict, ttl = await loader()
+                self.set(key, verdict, ttl)
+                return verdict
+
+            verdict, ttl = await loader(refresh=True)
+            entry = self._entries.peek(key)
+            if verdict is None and entry is not None:
+                # A failed refresh keeps serving the previous verdict and is
+                # retried after the error TTL
+                self._entries.set(
+                    key, (entry[0], self._clock() + self.error_ttl, entry[2])
+                )
+            elif verdict is not None:
+                self.set(key, verdict, ttl)
+            return verdict
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,58 @@
+# Providers that deliver "user+tag@" to "user@", and whether they also ignore
+# dots in the local part
+SUBADDRESS_RULES: dict[str, tuple[str, bool]] = {
+    "gmail.com": ("+", True),
+    "googlemail.com": ("+", True),
+    "outlook.com": ("+", False),
+    "hotmail.com": ("+", False),
+    "live.com": ("+", False),
+    "icloud.com": ("+", False),
+    "me.com": ("+", False),
+    "fastmail.com": ("+", False),
+    "protonmail.com": ("+", False),
+    "proton.me": ("+", False),
+}
+
+
+class CanonicalEmail:
+    __slots__ = ("raw", "local", "domain", "address")
+
+    def __init__(self, raw: str, local: str, domain: str):
+        self.raw = raw
+        self.local = local
+        self.domain = domain
+        self.address = f"{local}@{domain}"
+
+    def __repr__(self):
+        return f"CanonicalEmail({self.address!r})"
+
+
+def canonical_domain(domain: str) -> str:
+    # Unicode domains are compared in their punycode form, the one DNS and
+    # the blocklist feeds use
+    domain = domain.strip().lower().rstrip(".")
+    if not domain.isascii():
+        try:
+            domain = domain.encode("idna").decode("ascii")
+        except UnicodeError:
+            pass
+    return domain
+
+
+def canonicalize(email, strip_subaddress: bool = False) -> CanonicalEmail | None:
+    if not isinstance(email, str):
+        return None
+
+    email_parts = email.strip().split("@")
+    if len(email_parts) != 2:
+        return None
+
+    local = email_parts[0].strip().lower()
+    domain = canonical_domain(email_parts[1])
+    if strip_subaddress and domain in SUBADDRESS_RULES:
+        separator, ignore_dots = SUBADDRESS_RULES[domain]
+        local = local.partition(separator)[0] or local
+        if ignore_dots:
+            local = local.replace(".", "") or local
+
+    return CanonicalEmail(email, local, domain)
@@ -0,0 +1,47 @@
+import contextlib
+import contextvars
+import math
+import time
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class Deadline:
+    __slots__ = ("expires_at", "degraded")
+
+    def __init__(self, budget: float):
+        self.expires_at = time.monotonic() + budget
+        self.degraded = False
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+
+# Tasks copy the context they are created in, so lookups spawned while handling
+# a request keep seeing its deadline
+_current: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+@contextlib.contextmanager
+def deadline(budget: float):
+    current = Deadline(budget)
+    token = _current.set(current)
+    try:
+        yield current
+    finally:
+        _current.reset(token)
+
+
+def remaining() -> float:
+    current = _current.get()
+    return math.inf if current is None else current.remaining()
+
+
+def mark_degraded():
+    current = _current.get()
+    if current is not None:
+        current.degraded = True
@@ -0,0 +1,110 @@
+import asyncio
+import collections
+import time
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def _retrieve_exception(task: asyncio.Task):
+    if not task.cancelled():
+        task.exception()
+
+
+class Hedger:
+    # Sends a second, identical request when the first one hasn't answered
+    # within the given percentile of recent latencies. Whichever answers first
+    # wins and the other is cancelled. Each request earns `budget_percent / 100`
+    # of a hedge, so hedges never exceed that share of the traffic.
+    def __init__(
+        self,
+        percentile: float,
+        budget_percent: float,
+        min_delay: float,
+        window: int,
+        min_samples: int = 20,
+        admit: Callable[[], bool] | None = None,
+        on_fired: Callable[[], None] | None = None,
+        on_won: Callable[[], None] | None = None,
+    ):
+        self.percentile = percentile
+        self.budget_percent = budget_percent
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._admit = admit
+        self._on_fired = on_fired
+        self._on_won = on_won
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window)
+        self._delay: float | None = None
+        self._recorded_since_update = 0
+        self._tokens = 0.0
+
+    def delay(self) -> float | None:
+        # Sorting the window on every request would cost more than it's worth,
+        # the threshold is refreshed every few recorded latencies instead
+        if self._recorded_since_update >= max(self.min_samples // 4, 1):
+            self._recorded_since_update = 0
+            if len(self._latencies) >= self.min_samples:
+                latencies = sorted(self._latencies)
+                index = min(
+                    int(len(latencies) * self.percentile / 100), len(latencies) - 1
+                )
+                self._delay = max(latencies[index], self.min_delay)
+        return self._delay
+
+    def _record(self, latency: float):
+        self._latencies.append(latency)
+        self._recorded_since_update += 1
+
+    async def run(self, request: Callable[[], Awaitable[T]]) -> T:
+        # Timed from the first request's start until the answer, or until the
+        # caller gives up. A winning hedge counts as the first request's
+        # latency so far, or slow requests cut short by hedges would drop out
+        # of the window and pull the delay down until every request hedges.
+        started_at = time.monotonic()
+        try:
+            result = await self._race(request)
+        except asyncio.CancelledError:
+            self._record(time.monotonic() - started_at)
+            raise
+        self._record(time.monotonic() - started_at)
+        return result
+
+    async def _race(self, request: Callable[[], Awaitable[T]]) -> T:
+        self._tokens = min(self._tokens + self.budget_percent / 100, 10.0)
+
+        delay = self.delay()
+        primary = asyncio.ensure_future(request())
+        if delay is None:
+            return await primary
+
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or self._tokens < 1:
+                return await primary
+            if self._admit is not None and not self._admit():
+                return await primary
+
+            self._tokens -= 1
+            if self._on_fired is not None:
+                self._on_fired()
+            hedge = asyncio.ensure_future(request())
+
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda task: task is not primary):
+                    if task.exception() is None:
+                        if task is hedge and self._on_won is not None:
+                            self._on_won()
+                        return task.result()
+
+            return await primary
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.add_done_callback(_retrieve_exception)
+                    task.cancel()
@@ -0,0 +1,80 @@
+import httpx
+
+from logger import get_logger
+from metrics import http_pool_connections, http_pool_pending_requests
+from settings import conf
+
+logger = get_logger(__name__, conf.LOG_LEVEL)
+
+_client: httpx.AsyncClient | None = None
+
+
+def _get_pool(client: httpx.AsyncClient):
+    # httpx doesn't expose its connection pool publicly, the metrics below are
+    # best effort and read 0 if the transport internals ever change
+    return getattr(getattr(client, "_transport", None), "_pool", None)
+
+
+def _count_connections(state: str) -> int:
+    pool = _get_pool(_client) if _client is not None else None
+    if pool is None:
+        return 0
+
+    connections = getattr(pool, "connections", [])
+    if state == "idle":
+        return sum(1 for connection in connections if connection.is_idle())
+    return sum(1 for connection in connections if not connection.is_idle())
+
+
+def _count_pending_requests() -> int:
+    pool = _get_pool(_client) if _client is not None else None
+    if pool is None:
+        return 0
+
+    requests = getattr(pool, "_requests", [])
+    return sum(
+        1 for request in requests if getattr(request, "connection", None) is None
+    )
+
+
+def _register_pool_metrics():
+    for state in ("active", "idle"):
+        http_pool_connections.labels(state=state).set_function(
+            lambda state=state: _count_connections(state)
+        )
+    http_pool_pending_requests.set_function(_count_pending_requests)
+
+
+def _build_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=conf.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=conf.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=conf.HTTP_KEEPALIVE_EXPIRY,
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        timeout=conf.HTTP_TIMEOUT,
+        http2=conf.HTTP2_ENABLED,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = _build_client()
+        _register_pool_metrics()
+        logger.debug(
+            f"Created HTTP client | HTTP/2: {conf.HTTP2_ENABLED} | Max connections: {conf.HTTP_MAX_CONNECTIONS}"
+        )
+    return _client
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    return get_http_client()
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
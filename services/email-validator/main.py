@@ -1,38 +1,95 @@
 #!/usr/bin/env python
 
 
+import asyncio
+import csv
 import http
-import time
+import json
+import math
 
 import fastapi
+import orjson
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from deadline import deadline
+from http_client import close_http_client, start_http_client
 from logger import get_logger
+from middleware import RequestMiddleware
+from payloads import validation_response
 from settings import conf
-from tracing import init_tracing
-from validator import is_valid_domain, is_valid_email
+from tracing import init_tracing, set_span_attribute
+from validator import (
+    banned_domains,
+    run_validation,
+    shared_verdict_cache,
+    start_validation,
+    validate_emails,
+    validate_email_stream,
+    verdict_cache,
+    verdict_store,
+    verify_mail_breaker,
+)
 
 app = fastapi.FastAPI(
     title=conf.TRACING_SERVICE_NAME,
     swagger_ui_parameters={"displayRequestDuration": True},
 )
-init_tracing(app, conf.TRACING_SERVICE_NAME)
+if conf.TRACING_ENABLED:
+    init_tracing(app, conf.TRACING_SERVICE_NAME)
 instrumentor = Instrumentator().instrument(app)
-logger = get_logger(conf.LOG_LEVEL)
+logger = get_logger(__name__, conf.LOG_LEVEL)
 
 
 @app.on_event("startup")
-def startup():
+async def startup():
     instrumentor.expose(app)
+    await start_http_client()
+    banned_domains.start_watching()
+    if verdict_store is not None:
+        await verdict_store.open(warm_cache=verdict_cache)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await banned_domains.stop_watching()
+    if verdict_store is not None:
+        await verdict_store.close()
+    if shared_verdict_cache is not None:
+        await shared_verdict_cache.close()
+    await close_http_client()
 
 
 @app.get("/")
 async def index():
+    content = {"ready": True}
+    if verify_mail_breaker is not None:
+        content["verify_mail_circuit"] = verify_mail_breaker.state.value
+
     return fastapi.responses.JSONResponse(
-        content={"ready": True}, status_code=http.HTTPStatus.OK
+        content=content, status_code=http.HTTPStatus.OK
     )
 
 
+@app.get("/blocklist")
+async def blocklist():
+    return fastapi.responses.JSONResponse(
+        content={"version": banned_domains.version, "entries": len(banned_domains)},
+        status_code=http.HTTPStatus.OK,
+    )
+
+
+def _get_budget(request: fastapi.Request) -> float:
+    # Callers can only shorten the budget, a huge value would lift the deadline
+    # and a zero one would skip Verify Mail for any address
+    try:
+        budget = float(request.headers[conf.VALIDATION_BUDGET_HEADER]) / 1000
+    except (KeyError, ValueError):
+        return conf.VALIDATION_BUDGET
+    if not 0 < budget < math.inf:
+        return conf.VALIDATION_BUDGET
+    return min(budget, conf.VALIDATION_BUDGET)
+
+
 """
 Sending the following validation error in case of invalid email:
 
@@ -59,46 +116,118 @@ Sending the following validation error in case of invalid email:
 """
 @app.post("/validate")
 async def validate(request: fastapi.Request):
-    body = await request.json()
+    body = orjson.loads(await request.body())
     email = body.get("email")
+    validation = start_validation(email)
+
+    budget = _get_budget(request)
+    with deadline(budget) as current:
+        try:
+            await asyncio.wait_for(run_validation(validation), timeout=budget)
+        except asyncio.TimeoutError:
+            # Out of budget, answer with what can be checked locally
+            current.degraded = True
+            set_span_attribute("validation.degraded", True)
+            await run_validation(validation, local=True)
+    valid = validation.valid
+    logger.debug(
+        f"{email} decided by {validation.decided_by}, stage timings: {validation.timings}"
+    )
 
-    valid = await is_valid_domain(email) and await is_valid_email(email)
-
-    error_payload = {
-        "messages": [
-            {
-                "instance_ptr": "#/traits/email",
-                "messages": [
-                    {
-                        "id": 1,
-                        "text": "Only business emails are allowed.",
-                        "type": "error",
-                        "context": {"value": email},
-                    }
-                ],
-            }
+    return validation_response(valid, email, current.degraded)
+
+
+@app.post("/validate/batch")
+async def validate_batch(request: fastapi.Request):
+    body = await request.json()
+    emails = body.get("emails")
+
+    if not isinstance(emails, list) or len(emails) > conf.BATCH_MAX_SIZE:
+        return fastapi.responses.JSONResponse(
+            content={
+                "msg": f"Expected a list of at most {conf.BATCH_MAX_SIZE} emails."
+            },
+            status_code=http.HTTPStatus.BAD_REQUEST,
+        )
+
+    verdicts = await validate_emails(emails)
+
+    content = {
+        "results": [
+            {"email": email, "valid": valid} for email, valid in zip(emails, verdicts)
         ]
     }
+    return fastapi.responses.JSONResponse(
+        content=content, status_code=http.HTTPStatus.OK
+    )
+
 
-    if valid:
-        content = {"valid": True, "msg": "All good."}
-        status_code = http.HTTPStatus.OK
+class _DuplexStreamingResponse(fastapi.responses.StreamingResponse):
+    # StreamingResponse listens for the client disconnect on `receive`, which
+    # would swallow the request body that is still being streamed in while
+    # verdicts are streamed out. A disconnect surfaces through the request
+    # stream or `send` instead.
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def _read_lines(request: fastapi.Request):
+    buffer = b""
+    async for chunk in request.stream():
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            yield line.decode(errors="replace").strip()
+    if buffer:
+        yield buffer.decode(errors="replace").strip()
+
+
+async def _read_ndjson_emails(request: fastapi.Request):
+    line_number = 0
+    async for line in _read_lines(request):
+        line_number += 1
+        if not line:
+            continue
+
+        try:
+            item = json.loads(line)
+        except ValueError:
+            item = line
+        email = item.get("email") if isinstance(item, dict) else item
+        yield line_number, email if isinstance(email, str) else line
+
+
+async def _read_csv_emails(request: fastapi.Request):
+    line_number = 0
+    async for line in _read_lines(request):
+        line_number += 1
+        row = next(csv.reader([line]), None)
+        if not row:
+            continue
+
+        email = row[0].strip()
+        if line_number == 1 and email.lower() == "email":
+            continue
+        yield line_number, email
+
+
+@app.post("/validate/stream")
+async def validate_stream(request: fastapi.Request):
+    if "csv" in request.headers.get("content-type", ""):
+        emails = _read_csv_emails(request)
     else:
-        content = error_payload
-        status_code = http.HTTPStatus.BAD_REQUEST
+        emails = _read_ndjson_emails(request)
 
-    return fastapi.responses.JSONResponse(content=content, status_code=status_code)
+    async def verdicts():
+        async for line, email, valid in validate_email_stream(emails):
+            yield json.dumps({"line": line, "email": email, "valid": valid}) + "\n"
 
+    return _DuplexStreamingResponse(verdicts(), media_type="application/x-ndjson")
 
-@app.middleware("http")
-async def timeit(request: fastapi.Request, call_next):
-    start_time = time.time()
-    response: fastapi.Response = await call_next(request)
-    process_time = time.time() - start_time
-    logger.debug(
-        f"Request: {request.method} {request.url.path} | Response: {response.status_code} | Process Time: {process_time:.6f}s"
-    )
-    return response
+
+app.add_middleware(RequestMiddleware)
 
 
 if __name__ == "__main__":
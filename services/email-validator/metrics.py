@@ -0,0 +1,87 @@
+from prometheus_client import Counter, Enum, Gauge, Histogram
+
+http_pool_connections = Gauge(
+    "email_validator_http_pool_connections",
+    "Connections held by the Verify Mail HTTP client pool",
+    ["state"],
+)
+http_pool_pending_requests = Gauge(
+    "email_validator_http_pool_pending_requests",
+    "Requests waiting for a connection from the Verify Mail HTTP client pool",
+)
+verify_mail_circuit_state = Enum(
+    "email_validator_verify_mail_circuit_state",
+    "State of the circuit breaker around Verify Mail",
+    states=["closed", "open", "half_open"],
+)
+verify_mail_short_circuited = Counter(
+    "email_validator_verify_mail_short_circuited_total",
+    "Verify Mail calls skipped because the circuit breaker was open",
+)
+verify_mail_hedges_fired = Counter(
+    "email_validator_verify_mail_hedges_fired_total",
+    "Hedged Verify Mail requests sent because the first one was slow",
+)
+verify_mail_hedges_won = Counter(
+    "email_validator_verify_mail_hedges_won_total",
+    "Hedged Verify Mail requests that answered before the first one",
+)
+verify_mail_rate_limit_queue_depth = Gauge(
+    "email_validator_verify_mail_rate_limit_queue_depth",
+    "Verify Mail calls waiting for a rate limiter token",
+    ["priority"],
+)
+verify_mail_rate_limit_wait_seconds = Histogram(
+    "email_validator_verify_mail_rate_limit_wait_seconds",
+    "Time Verify Mail calls waited for a rate limiter token",
+    ["priority"],
+    buckets=(0, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+verify_mail_rate_limited = Counter(
+    "email_validator_verify_mail_rate_limited_total",
+    "Verify Mail calls that couldn't get a rate limiter token in time",
+    ["priority"],
+)
+verdict_cache_lookups = Counter(
+    "email_validator_verdict_cache_lookups_total",
+    "Domain verdict lookups per cache tier (memory, store, shared)",
+    ["tier", "result"],
+)
+verdict_cache_refresh_errors = Counter(
+    "email_validator_verdict_cache_refresh_errors_total",
+    "Background refreshes of cached verdicts that raised an error",
+)
+verify_mail_request_duration = Histogram(
+    "email_validator_verify_mail_request_duration_seconds",
+    "Verify Mail request latency by status class, timeout or error",
+    ["status"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+syntax_fallbacks = Counter(
+    "email_validator_syntax_fallbacks_total",
+    "Emails validated by the syntax check alone because Verify Mail had no verdict",
+)
+banned_domain_hits = Counter(
+    "email_validator_banned_domain_hits_total",
+    "Emails rejected because their domain is banned",
+)
+validation_stage_duration = Histogram(
+    "email_validator_validation_stage_duration_seconds",
+    "Time spent in each validation stage",
+    ["stage"],
+    buckets=(0.00001, 0.0001, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+validation_stage_results = Counter(
+    "email_validator_validation_stage_results_total",
+    "Validation stage outcomes: valid, invalid or pass to the next stage",
+    ["stage", "result"],
+)
+trace_spans_dropped = Counter(
+    "email_validator_trace_spans_dropped_total",
+    "Spans dropped because the trace export queue was full",
+)
+trace_tail_sampling_decisions = Counter(
+    "email_validator_trace_tail_sampling_decisions_total",
+    "Traces kept or dropped by tail sampling",
+    ["decision"],
+)
@@ -0,0 +1,61 @@
+import json
+import logging
+import time
+
+from logger import get_logger
+from settings import conf
+from tracing import get_remote_span
+
+logger = get_logger(__name__, conf.LOG_LEVEL)
+
+
+class RequestMiddleware:
+    # Times the request, extracts the incoming traceparent and logs one
+    # structured line per request, all in a single pass. Plain ASGI rather
+    # than @app.middleware("http"): BaseHTTPMiddleware adds a task and a
+    # stream per request, and competes with the endpoint for request body
+    # messages, which breaks /validate/stream reading its input while
+    # streaming verdicts back.
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started_at = time.perf_counter()
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        span = get_remote_span(traceparent)
+        if span is not None:
+            scope.setdefault("state", {})["span"] = span
+
+        status_code = None
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    json.dumps(
+                        {
+                            "method": scope["method"],
+                            "path": scope["path"],
+                            "status": status_code,
+                            "duration_ms": round(
+                                (time.perf_counter() - started_at) * 1000, 3
+                            ),
+                            "traceparent": traceparent,
+                        }
+                    )
+                )
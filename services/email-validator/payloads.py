@@ -0,0 +1,59 @@
+import http
+import json
+
+import fastapi
+import orjson
+
+_VALUE = "__value__"
+
+
+def _dumps(content) -> bytes:
+    # Same bytes JSONResponse would render
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _with_degraded(content: dict) -> dict[bool, bytes]:
+    return {False: _dumps(content), True: _dumps({**content, "degraded": True})}
+
+
+def error_content(value) -> dict:
+    return {
+        "messages": [
+            {
+                "instance_ptr": "#/traits/email",
+                "messages": [
+                    {
+                        "id": 1,
+                        "text": "Only business emails are allowed.",
+                        "type": "error",
+                        "context": {"value": value},
+                    }
+                ],
+            }
+        ]
+    }
+
+
+# /validate only ever answers with a few bodies, they are serialized once here
+# and only the rejected email is encoded per request, between prefix and suffix
+_valid_bodies = _with_degraded({"valid": True, "msg": "All good."})
+_invalid_bodies = {
+    degraded: tuple(body.split(_dumps(_VALUE)))
+    for degraded, body in _with_degraded(error_content(_VALUE)).items()
+}
+
+
+def validation_response(valid: bool, email, degraded: bool) -> fastapi.Response:
+    if valid:
+        return fastapi.Response(
+            _valid_bodies[degraded],
+            status_code=http.HTTPStatus.OK,
+            media_type="application/json",
+        )
+
+    prefix, suffix = _invalid_bodies[degraded]
+    return fastapi.Response(
+        prefix + orjson.dumps(email) + suffix,
+        status_code=http.HTTPStatus.BAD_REQUEST,
+        media_type="application/json",
+    )
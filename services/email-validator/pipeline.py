@@ -0,0 +1,82 @@
+import inspect
+import time
+from typing import Awaitable, Callable
+
+from canonical import CanonicalEmail
+
+# A stage returns True or False when it can decide on its own, or None to
+# leave the decision to the next stages. It may be a coroutine function.
+Stage = Callable[[CanonicalEmail], bool | None | Awaitable[bool | None]]
+
+
+class Validation:
+    # One email going through the pipeline. Stages that already ran are
+    # recorded in `timings`, so a validation can be resumed by another
+    # pipeline without running them twice.
+    __slots__ = ("email", "valid", "decided_by", "timings")
+
+    def __init__(self, email: CanonicalEmail | None):
+        self.email = email
+        self.valid = True
+        self.decided_by: str | None = None
+        self.timings: dict[str, float] = {}
+
+    def __repr__(self):
+        return (
+            f"Validation({self.email!r}, valid={self.valid}, "
+            f"decided_by={self.decided_by!r})"
+        )
+
+
+class Pipeline:
+    # Runs the stages in order and stops at the first decisive one. An email
+    # that passes every stage is valid, one that couldn't be parsed never is.
+    def __init__(
+        self,
+        stages: list[tuple[str, Stage]],
+        on_stage: Callable[[str, float, bool | None], None] | None = None,
+    ):
+        self.stages = stages
+        self._on_stage = on_stage
+
+    @property
+    def names(self) -> list[str]:
+        return [name for name, _ in self.stages]
+
+    def without(self, *names: str) -> "Pipeline":
+        return Pipeline(
+            [(name, stage) for name, stage in self.stages if name not in names],
+            on_stage=self._on_stage,
+        )
+
+    async def run(self, validation: Validation) -> Validation:
+        if validation.decided_by is not None:
+            return validation
+
+        if validation.email is None:
+            validation.valid = False
+            validation.decided_by = "parse"
+            if self._on_stage is not None:
+                self._on_stage("parse", 0.0, False)
+            return validation
+
+        for name, stage in self.stages:
+            if name in validation.timings:
+                continue
+
+            started_at = time.perf_counter()
+            result = stage(validation.email)
+            if inspect.isawaitable(result):
+                result = await result
+            elapsed = time.perf_counter() - started_at
+
+            validation.timings[name] = elapsed
+            if self._on_stage is not None:
+                self._on_stage(name, elapsed, result)
+
+            if result is not None:
+                validation.valid = result
+                validation.decided_by = name
+                break
+
+        return validation
@@ -0,0 +1,132 @@
+import asyncio
+import contextlib
+import contextvars
+import enum
+import heapq
+import itertools
+import time
+from typing import Callable
+
+
+class Priority(enum.IntEnum):
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class RateLimitExceeded(Exception):
+    pass
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "priority", default=Priority.INTERACTIVE
+)
+
+
+@contextlib.contextmanager
+def priority(value: Priority):
+    # Tasks created inside inherit the priority, so wrapping a gather() is
+    # enough to mark all of its lookups
+    token = _priority.set(value)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+class TokenBucket:
+    # Tokens refill at `rate` per second up to `burst`. Callers that find the
+    # bucket empty queue up and are served by priority, then in arrival order,
+    # as tokens refill. A caller that can't be served within its timeout is
+    # rejected right away instead of waiting for nothing.
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        on_acquired: Callable[[Priority, float], None] | None = None,
+        on_rejected: Callable[[Priority], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._on_acquired = on_acquired
+        self._on_rejected = on_rejected
+        self._clock = clock
+
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._waiters: list[tuple[Priority, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._queue_depth = {value: 0 for value in Priority}
+        self._timer: asyncio.TimerHandle | None = None
+
+    def queue_depth(self, value: Priority) -> int:
+        return self._queue_depth[value]
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(
+            self._tokens + (now - self._updated_at) * self.rate, self.burst
+        )
+        self._updated_at = now
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._waiters or self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def acquire(self, timeout: float, value: Priority | None = None):
+        if value is None:
+            value = current_priority()
+
+        if self.try_acquire():
+            if self._on_acquired is not None:
+                self._on_acquired(value, 0.0)
+            return
+
+        ahead = sum(1 for waiter in self._waiters if waiter[0] <= value)
+        if (ahead + 1 - self._tokens) / self.rate > timeout:
+            if self._on_rejected is not None:
+                self._on_rejected(value)
+            raise RateLimitExceeded()
+
+        started_at = self._clock()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (value, next(self._sequence), future))
+        self._queue_depth[value] += 1
+        self._schedule()
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            if self._on_rejected is not None:
+                self._on_rejected(value)
+            raise RateLimitExceeded() from None
+        finally:
+            self._queue_depth[value] -= 1
+
+        if self._on_acquired is not None:
+            self._on_acquired(value, self._clock() - started_at)
+
+    def _schedule(self):
+        if self._timer is None and self._waiters:
+            delay = max((1 - self._tokens) / self.rate, 0)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _dispatch(self):
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            # Waiters that timed out or were cancelled don't take a token
+            if not future.done():
+                self._tokens -= 1
+                future.set_result(None)
+
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        self._schedule()
@@ -1,3 +1,6 @@
+import os
+from typing import Literal
+
 import pydantic
 import pydantic_settings
 
@@ -6,7 +9,18 @@ class AppConfig(pydantic_settings.BaseSettings):
     VERIFY_MAIL_API_KEY: str
     VERIFY_MAIL_URL: str = "https://verifymail.io/api/{email}?key={api_key}"
     OTEL_EXPORTER_OTLP_ENDPOINT: str = "http://localhost:4317"
+    # Needs the packages from requirements-tracing.txt
+    TRACING_ENABLED: bool = False
     TRACING_SERVICE_NAME: str = "email-validator"
+    # Share of new traces recorded, requests carrying a sampled traceparent
+    # are always recorded
+    TRACING_SAMPLE_RATIO: float = 1.0
+    # Recorded traces are only exported when they failed, were degraded or
+    # slow, plus TRACING_TAIL_KEEP_RATIO of the rest
+    TRACING_TAIL_SAMPLING: bool = False
+    TRACING_TAIL_SLOW_THRESHOLD: float = 0.5
+    TRACING_TAIL_KEEP_RATIO: float = 0.05
+    TRACING_EXPORT_QUEUE_SIZE: int = 2048
     LOG_LEVEL: str = "INFO"
 
     DEBUG: bool = False
@@ -14,10 +28,82 @@ class AppConfig(pydantic_settings.BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
 
+    # Drops "+tag" (and dots for Gmail) from addresses at providers known to
+    # ignore them, see canonical.SUBADDRESS_RULES
+    CANONICAL_STRIP_SUBADDRESS: bool = False
+
+    VALIDATION_BUDGET: float = 0.5
+    VALIDATION_BUDGET_HEADER: str = "X-Validation-Budget-Ms"
+
     HTTP_TIMEOUT: float = 3.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2_ENABLED: bool = False
     BACKOFF_MAX_TIME: float = 8.0
 
-    LRU_CACHE_SIZE: int = 256
+    # Verify Mail calls per second allowed by the API key quota, unlimited
+    # when unset
+    RATE_LIMIT_PER_SECOND: float | None = None
+    RATE_LIMIT_BURST: int = 10
+    RATE_LIMIT_MAX_WAIT: float = 10.0
+
+    HEDGING_ENABLED: bool = False
+    HEDGING_PERCENTILE: float = 95.0
+    HEDGING_BUDGET_PERCENT: float = 5.0
+    HEDGING_MIN_DELAY: float = 0.05
+    HEDGING_WINDOW: int = 1000
+
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_WINDOW: float = 30.0
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_ERROR_RATE: float = 0.5
+    # Must be below VALIDATION_BUDGET, calls are cut short at the deadline
+    CIRCUIT_BREAKER_SLOW_CALL_DURATION: float = 0.4
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.8
+    CIRCUIT_BREAKER_OPEN_DURATION: float = 15.0
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = 3
+
+    BANNED_DOMAINS_PATH: str = os.path.join(
+        os.path.dirname(__file__), "data", "banned_domains.txt"
+    )
+    BANNED_DOMAINS_RELOAD_INTERVAL: float = 30.0
+    # Domains that are always accepted, same format as the banned domains file
+    ALLOWED_DOMAINS_PATH: str | None = None
+
+    # Checks run on every email, in this order, until one of them decides.
+    # Emails none of them decides fall back to the syntax rules. See
+    # validator.VALIDATION_STAGES.
+    VALIDATION_STAGES: list[str] = [
+        "syntax",
+        "allowlist",
+        "blocklist",
+        "cache",
+        "upstream",
+    ]
+
+    VERDICT_CACHE_SIZE: int = 10000
+    VERDICT_CACHE_POLICY: Literal["lru", "tinylfu"] = "tinylfu"
+    VERDICT_CACHE_POSITIVE_TTL: float = 6 * 60 * 60
+    VERDICT_CACHE_NEGATIVE_TTL: float = 24 * 60 * 60
+    VERDICT_CACHE_ERROR_TTL: float = 30.0
+    # Fraction of the TTL after which hits refresh a verdict in the background,
+    # and how long past expiry it's still served while that refresh runs
+    VERDICT_CACHE_REFRESH_AHEAD: float = 0.8
+    VERDICT_CACHE_STALE_GRACE: float = 5 * 60
+
+    VERDICT_STORE_PATH: str | None = None
+    VERDICT_STORE_FLUSH_INTERVAL: float = 1.0
+    VERDICT_STORE_BATCH_SIZE: int = 500
+
+    SHARED_CACHE_URL: str | None = None
+    SHARED_CACHE_PREFIX: str = "email-validator:verdict:"
+    SHARED_CACHE_TIMEOUT: float = 0.05
+    SHARED_CACHE_RETRY_AFTER: float = 10.0
+
+    BATCH_MAX_SIZE: int = 10000
+    BATCH_UPSTREAM_CONCURRENCY: int = 10
+    STREAM_MAX_IN_FLIGHT: int = 100
 
     @pydantic.validator("LOG_LEVEL")
     def validate_log_level(cls, v):
@@ -27,5 +113,15 @@ class AppConfig(pydantic_settings.BaseSettings):
             raise ValueError("LOG_LEVEL must be one of INFO, DEBUG, ERROR")
         return v
 
+    @pydantic.validator("CIRCUIT_BREAKER_SLOW_CALL_DURATION")
+    def validate_slow_call_duration(cls, v, values):
+        if values.get("CIRCUIT_BREAKER_ENABLED") and v >= values.get(
+            "VALIDATION_BUDGET", float("inf")
+        ):
+            raise ValueError(
+                "CIRCUIT_BREAKER_SLOW_CALL_DURATION must be below VALIDATION_BUDGET"
+            )
+        return v
+
 
 conf = AppConfig()
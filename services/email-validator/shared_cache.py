@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+from cache import MISSING
+from deadline import remaining
+from logger import get_logger
+from settings import conf
+
+logger = get_logger(__name__, conf.LOG_LEVEL)
+
+
+class SharedVerdictCache:
+    # Verdict tier shared by all replicas over the Redis protocol. Reads issued
+    # in the same event loop tick are sent as one pipeline, and any failure or
+    # timeout is treated as a miss so an outage never delays validation. After
+    # a failure the tier is skipped entirely until `retry_after` has passed.
+    def __init__(self, client, prefix: str, timeout: float, retry_after: float):
+        self._client = client
+        self.prefix = prefix
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._disabled_until = 0.0
+        self._reads: dict[str, list[asyncio.Future]] = {}
+        self._writes: dict[str, tuple[bool, float]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str, timeout: float, retry_after: float):
+        import redis.asyncio
+
+        client = redis.asyncio.from_url(
+            url, socket_timeout=timeout, socket_connect_timeout=timeout
+        )
+        return cls(client, prefix=prefix, timeout=timeout, retry_after=retry_after)
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._disabled_until
+
+    def _key(self, domain: str) -> str:
+        return f"{self.prefix}{domain}"
+
+    def _fail(self, action: str, error: BaseException):
+        self._disabled_until = time.monotonic() + self.retry_after
+        logger.warning(
+            f"Shared verdict cache {action} failed, skipping it for {self.retry_after}s: {error!r}"
+        )
+
+    def _spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def get(self, domain: str):
+        timeout = min(self.timeout, remaining())
+        if not self.available or timeout <= 0:
+            return MISSING, 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        if not self._reads:
+            self._spawn(self._read_batch())
+        self._reads.setdefault(domain, []).append(future)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError as e:
+            if timeout >= self.timeout:
+                self._fail("read", e)
+            return MISSING, 0.0
+
+    async def _read_batch(self):
+        # Runs one tick after the first read was queued, by then every read
+        # issued in the meantime has joined the batch
+        reads, self._reads = self._reads, {}
+        domains = list(reads)
+
+        results = None
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for domain in domains:
+                    pipe.get(self._key(domain))
+                    pipe.pttl(self._key(domain))
+                results = await asyncio.wait_for(pipe.execute(), self.timeout)
+        except Exception as e:
+            self._fail("read", e)
+
+        for index, domain in enumerate(domains):
+            value = MISSING, 0.0
+            if results is not None:
+                verdict, ttl_ms = results[2 * index], results[2 * index + 1]
+                if verdict is not None and ttl_ms > 0:
+                    value = verdict == b"1", ttl_ms / 1000
+            for future in reads[domain]:
+                if not future.done():
+                    future.set_result(value)
+
+    def put(self, domain: str, verdict: bool, ttl: float):
+        if not self.available or ttl <= 0:
+            return
+
+        if not self._writes:
+            self._spawn(self._write_batch())
+        self._writes[domain] = verdict, ttl
+
+    async def _write_batch(self):
+        writes, self._writes = self._writes, {}
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for domain, (verdict, ttl) in writes.items():
+                    pipe.set(
+                        self._key(domain), b"1" if verdict else b"0", px=int(ttl * 1000)
+                    )
+                await asyncio.wait_for(pipe.execute(), self.timeout)
+        except Exception as e:
+            self._fail("write", e)
+
+    async def close(self):
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._client.close()
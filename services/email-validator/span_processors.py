@@ -0,0 +1,103 @@
+import collections
+import threading
+
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.trace import StatusCode
+
+from metrics import trace_spans_dropped, trace_tail_sampling_decisions
+
+# The SDK's default
+_MAX_EXPORT_BATCH_SIZE = 512
+
+
+class DropCountingSpanProcessor(BatchSpanProcessor):
+    # The SDK only logs spans dropped on a full export queue. Where the queue
+    # lives depends on the SDK version, drops aren't counted when it can't
+    # be found.
+    def __init__(self, span_exporter, max_queue_size: int):
+        # Batches can't be larger than the queue, the SDK refuses to start
+        super().__init__(
+            span_exporter,
+            max_queue_size=max_queue_size,
+            max_export_batch_size=min(_MAX_EXPORT_BATCH_SIZE, max_queue_size),
+        )
+        self._max_queue_size = max_queue_size
+        self._queue = getattr(self, "queue", None)
+        if self._queue is None:
+            self._queue = getattr(
+                getattr(self, "_batch_processor", None), "_queue", None
+            )
+
+    def on_end(self, span: ReadableSpan):
+        if self._queue is not None and len(self._queue) >= self._max_queue_size:
+            trace_spans_dropped.inc()
+        super().on_end(span)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    # Holds the spans of each trace until its local root span ends, then
+    # exports the trace if any span failed or was degraded, if the root took
+    # `slow_threshold` seconds or more, or for `keep_ratio` of the rest.
+    # Spans ending after their root follow the decision made for the trace.
+    def __init__(
+        self,
+        processor: SpanProcessor,
+        slow_threshold: float,
+        keep_ratio: float,
+        max_traces: int = 10000,
+    ):
+        self._processor = processor
+        self.slow_threshold = slow_threshold
+        self.keep_ratio = keep_ratio
+        self.max_traces = max_traces
+        self._pending: collections.OrderedDict[int, list[ReadableSpan]] = (
+            collections.OrderedDict()
+        )
+        self._decisions: collections.OrderedDict[int, bool] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _keep(self, root: ReadableSpan, spans: list[ReadableSpan]) -> bool:
+        for span in spans:
+            if span.status.status_code is StatusCode.ERROR:
+                return True
+            if span.attributes.get("validation.degraded"):
+                return True
+
+        if (root.end_time - root.start_time) / 1e9 >= self.slow_threshold:
+            return True
+        # Same rule as TraceIdRatioBased, so the decision is stable per trace
+        return root.context.trace_id & 0xFFFFFFFFFFFFFFFF < self.keep_ratio * 2**64
+
+    def on_end(self, span: ReadableSpan):
+        trace_id = span.context.trace_id
+        is_root = span.parent is None or span.parent.is_remote
+
+        with self._lock:
+            keep = self._decisions.get(trace_id)
+            if keep is None and not is_root:
+                self._pending.setdefault(trace_id, []).append(span)
+                if len(self._pending) > self.max_traces:
+                    self._pending.popitem(last=False)
+                return
+
+            spans = [span]
+            if keep is None:
+                spans = self._pending.pop(trace_id, []) + spans
+                keep = self._keep(span, spans)
+                self._decisions[trace_id] = keep
+                if len(self._decisions) > self.max_traces:
+                    self._decisions.popitem(last=False)
+                trace_tail_sampling_decisions.labels(
+                    "kept" if keep else "dropped"
+                ).inc()
+
+        if keep:
+            for pending_span in spans:
+                self._processor.on_end(pending_span)
+
+    def shutdown(self):
+        self._processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._processor.force_flush(timeout_millis)
@@ -0,0 +1,151 @@
+import asyncio
+import concurrent.futures
+import sqlite3
+import time
+
+from cache import MISSING, VerdictCache
+from logger import get_logger
+from settings import conf
+
+logger = get_logger(__name__, conf.LOG_LEVEL)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    domain TEXT PRIMARY KEY,
+    verdict INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verdicts_expires_at ON verdicts (expires_at);
+"""
+
+
+class VerdictStore:
+    # SQLite backed verdict store, all database access happens on a single
+    # worker thread so the event loop never waits on disk I/O. Only upstream
+    # verdicts are persisted, errors are never worth surviving a restart.
+    def __init__(self, path: str, flush_interval: float, batch_size: int):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="verdict-store"
+        )
+        self._connection: sqlite3.Connection | None = None
+        self._pending: dict[str, tuple[bool, float]] = {}
+        self._flush_requested = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def _connect(self):
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def _select(self, domain: str):
+        return self._connection.execute(
+            "SELECT verdict, expires_at FROM verdicts WHERE domain = ? AND expires_at > ?",
+            (domain, time.time()),
+        ).fetchone()
+
+    def _select_recent(self, limit: int):
+        return self._connection.execute(
+            "SELECT domain, verdict, expires_at FROM verdicts WHERE expires_at > ? "
+            "ORDER BY expires_at DESC LIMIT ?",
+            (time.time(), limit),
+        ).fetchall()
+
+    def _write(self, rows: list[tuple[str, bool, float]]):
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO verdicts (domain, verdict, expires_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._connection.execute(
+                "DELETE FROM verdicts WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def _close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def open(self, warm_cache: VerdictCache | None = None):
+        await self._run(self._connect)
+        self._tasks.append(asyncio.create_task(self._flush_periodically()))
+        if warm_cache is not None:
+            self._tasks.append(asyncio.create_task(self._warm(warm_cache)))
+        logger.info(f"Opened verdict store at {self.path}")
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        await self.flush()
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    async def _warm(self, cache: VerdictCache):
+        try:
+            rows = await self._run(self._select_recent, cache.maxsize)
+        except sqlite3.Error as e:
+            logger.error(f"Failed warming verdict cache from {self.path}: {e!r}")
+            return
+
+        now = time.time()
+        for domain, verdict, expires_at in rows:
+            if cache.get(domain) is MISSING:
+                cache.set(domain, bool(verdict), ttl=expires_at - now)
+        logger.info(f"Warmed verdict cache with {len(rows)} stored verdicts")
+
+    async def get(self, domain: str):
+        entry = self._pending.get(domain)
+        if entry is None:
+            try:
+                entry = await self._run(self._select, domain)
+            except sqlite3.Error as e:
+                logger.error(f"Failed reading verdict store: {e!r}")
+                return MISSING, 0.0
+        if entry is None:
+            return MISSING, 0.0
+
+        verdict, expires_at = entry
+        ttl = expires_at - time.time()
+        if ttl <= 0:
+            return MISSING, 0.0
+        return bool(verdict), ttl
+
+    def put(self, domain: str, verdict: bool, ttl: float):
+        self._pending[domain] = (verdict, time.time() + ttl)
+        if len(self._pending) >= self.batch_size:
+            self._flush_requested.set()
+
+    async def flush(self):
+        if not self._pending or self._connection is None:
+            return
+
+        rows = [
+            (domain, verdict, expires_at)
+            for domain, (verdict, expires_at) in self._pending.items()
+        ]
+        self._pending = {}
+        try:
+            await self._run(self._write, rows)
+        except sqlite3.Error as e:
+            logger.error(f"Failed writing {len(rows)} verdicts to store: {e!r}")
+
+    async def _flush_periodically(self):
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
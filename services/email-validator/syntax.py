@@ -0,0 +1,58 @@
+import re
+import string
+
+# The pattern is kept as the reference is_valid_syntax reproduces exactly. Its
+# nested quantifiers make re.fullmatch backtrack exponentially on crafted local
+# parts, so it must never run on request input.
+email_regex = re.compile(
+    r"([A-Za-z0-9]+[.-_+])*[A-Za-z0-9]+@[A-Za-z0-9-]+(\.[A-Z|a-z]{2,})+"
+)
+
+_ALNUM = string.ascii_letters + string.digits
+# "[.-_+]" is the range "." to "_" plus "+", not four literal characters, and
+# the characters of that range that aren't alphanumeric act as separators
+_SEPARATORS = (
+    "".join(
+        char for char in map(chr, range(ord("."), ord("_") + 1)) if char not in _ALNUM
+    )
+    + "+"
+)
+
+_LOCAL_CLASSES = str.maketrans(
+    {**{char: "a" for char in _ALNUM}, **{char: "." for char in _SEPARATORS}}
+)
+_HOST_CLASSES = str.maketrans({char: "a" for char in _ALNUM + "-"})
+# "[A-Z|a-z]" allows a literal "|" in the top level labels
+_LABEL_CLASSES = str.maketrans({char: "a" for char in string.ascii_letters + "|"})
+
+
+def _only(classes: str, allowed: str) -> bool:
+    return not classes.replace(allowed, "")
+
+
+def is_valid_syntax(email: str) -> bool:
+    # Single pass equivalent of re.fullmatch(email_regex, email). The domain
+    # can't contain "@", so the address splits at the last one, while the
+    # local part may contain more since "@" is one of the separators.
+    local, at, domain = email.rpartition("@")
+    if not local or not local.isascii() or not domain.isascii():
+        return False
+
+    # Alphanumeric runs joined by single separators
+    local_classes = local.translate(_LOCAL_CLASSES)
+    if (
+        local_classes[0] != "a"
+        or local_classes[-1] != "a"
+        or ".." in local_classes
+        or not _only(local_classes.replace(".", ""), "a")
+    ):
+        return False
+
+    host, dot, labels = domain.partition(".")
+    if not dot or not host or not _only(host.translate(_HOST_CLASSES), "a"):
+        return False
+
+    for label in labels.split("."):
+        if len(label) < 2 or not _only(label.translate(_LABEL_CLASSES), "a"):
+            return False
+    return True
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import os
+import signal
+
+import pytest
+
+from blocklist import ReloadableBlocklist
+
+
+def _write(path: str, content: bytes, mtime: float):
+    with open(path, "wb") as f:
+        f.write(content)
+    os.utime(path, (mtime, mtime))
+
+
+async def _wait_for(predicate, timeout: float = 1.0):
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+
+@pytest.fixture
+async def blocklist(tmp_path):
+    path = str(tmp_path / "banned_domains.txt")
+    _write(path, b"# version: 1\ntrash.com\n", 1000)
+    blocklist = ReloadableBlocklist(path, reload_interval=0.01)
+    blocklist.start_watching()
+    yield blocklist
+    await blocklist.stop_watching()
+
+
+def test_matches_parent_domains(blocklist):
+    assert blocklist.match("mail.trash.com") == "trash.com"
+    assert "example.com" not in blocklist
+    assert blocklist.version == "1"
+
+
+async def test_reloads_when_the_file_changes(blocklist):
+    _write(blocklist.path, b"# version: 2\nspam.org\n", 2000)
+    await _wait_for(lambda: blocklist.version == "2")
+
+    assert "spam.org" in blocklist
+    assert "trash.com" not in blocklist
+
+
+async def test_reloads_on_sighup(blocklist):
+    # Same mtime, only the signal can pick the change up
+    _write(blocklist.path, b"# version: 2\nspam.org\n", 1000)
+    os.kill(os.getpid(), signal.SIGHUP)
+    await _wait_for(lambda: blocklist.version == "2")
+
+    assert "spam.org" in blocklist
+
+
+async def test_failed_reload_keeps_the_old_list_and_logs_once(blocklist, caplog):
+    _write(blocklist.path, b"\xff\xfe not utf-8\n", 2000)
+    await _wait_for(lambda: blocklist._mtime == 2000)
+    await asyncio.sleep(0.05)
+
+    assert "trash.com" in blocklist
+    assert blocklist.version == "1"
+    errors = [r for r in caplog.records if r.levelno == logging.ERROR]
+    assert len(errors) == 1
+
+    _write(blocklist.path, b"# version: 3\nspam.org\n", 3000)
+    await _wait_for(lambda: blocklist.version == "3")
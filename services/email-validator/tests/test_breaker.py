@@ -0,0 +1,117 @@
+from breaker import CircuitBreaker, CircuitState
+
+
+def _breaker(clock, states: list | None = None) -> CircuitBreaker:
+    return CircuitBreaker(
+        window=30,
+        min_calls=4,
+        error_rate=0.5,
+        slow_call_duration=1.0,
+        slow_call_rate=0.75,
+        open_duration=10,
+        half_open_calls=2,
+        on_state_change=states.append if states is not None else None,
+        clock=clock,
+    )
+
+
+def _call(breaker: CircuitBreaker, duration: float = 0.1, failed: bool = False):
+    assert breaker.allow()
+    breaker.record(duration, failed=failed)
+
+
+def test_opens_on_error_rate(clock):
+    states = []
+    breaker = _breaker(clock, states)
+    _call(breaker, failed=True)
+    _call(breaker, failed=True)
+    _call(breaker)
+    assert breaker.state == CircuitState.CLOSED
+
+    _call(breaker)
+    assert breaker.state == CircuitState.OPEN
+    assert states == [CircuitState.OPEN]
+    assert not breaker.allow()
+
+
+def test_needs_min_calls(clock):
+    breaker = _breaker(clock)
+    for _ in range(3):
+        _call(breaker, failed=True)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_opens_on_slow_call_rate(clock):
+    breaker = _breaker(clock)
+    for _ in range(3):
+        _call(breaker, duration=1.0)
+    _call(breaker)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_outcomes_expire_with_the_window(clock):
+    breaker = _breaker(clock)
+    _call(breaker, failed=True)
+    _call(breaker, failed=True)
+
+    clock.now = 31
+    _call(breaker, failed=True)
+    for _ in range(3):
+        _call(breaker)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_probes_close_the_circuit(clock):
+    states = []
+    breaker = _breaker(clock, states)
+    for _ in range(4):
+        _call(breaker, failed=True)
+
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow()
+    # Only half_open_calls probes at a time
+    assert not breaker.allow()
+
+    breaker.record(0.1, failed=False)
+    breaker.record(0.1, failed=False)
+    assert states == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+
+
+def test_bad_probe_reopens(clock):
+    breaker = _breaker(clock)
+    for _ in range(4):
+        _call(breaker, failed=True)
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record(1.5, failed=False)
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_released_probe_frees_its_slot(clock):
+    breaker = _breaker(clock)
+    for _ in range(4):
+        _call(breaker, failed=True)
+
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+
+def test_unanswered_calls_count_once_slow(clock):
+    breaker = _breaker(clock)
+    for _ in range(4):
+        assert breaker.allow()
+        breaker.record_unanswered(0.5)
+    assert breaker.state == CircuitState.CLOSED
+
+    for _ in range(4):
+        assert breaker.allow()
+        breaker.record_unanswered(1.0)
+    assert breaker.state == CircuitState.OPEN
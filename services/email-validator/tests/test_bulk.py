@@ -0,0 +1,29 @@
+import bulk
+import validator
+
+EMAILS = ["john@eu.my-company.com", "o'brien@corp.com", "bad", "a@b..com"]
+
+
+def test_check_chunk_leaves_legacy_syntax_to_the_fallback():
+    assert bulk._check_chunk(EMAILS, fallback=False) == [
+        bulk.REASON_UNVERIFIED,
+        bulk.REASON_UNVERIFIED,
+        bulk.REASON_SYNTAX,
+        bulk.REASON_SYNTAX,
+    ]
+    assert bulk._check_chunk(EMAILS, fallback=True) == [bulk.REASON_SYNTAX] * 4
+
+
+async def test_unanswered_domains_fall_back_to_the_legacy_syntax(monkeypatch):
+    async def request_verify_mail(email: str) -> bool | None:
+        return None if email.endswith("@corp.com") else True
+
+    monkeypatch.setattr(validator, "_request_verify_mail", request_verify_mail)
+    validator.verdict_cache.clear()
+    emails = ["john@eu.my-company.com", "o'brien@corp.com", "john@corp.com"]
+    reasons = bulk._check_chunk(emails, fallback=False)
+
+    await bulk._verify_unverified(emails, reasons)
+
+    assert reasons == [bulk.REASON_OK, bulk.REASON_SYNTAX, bulk.REASON_UNVERIFIED]
+    validator.verdict_cache.clear()
@@ -0,0 +1,161 @@
+import asyncio
+import math
+
+from cache import FrequencySketch, LRUPolicy, TinyLFUPolicy, VerdictCache
+from deadline import deadline, remaining
+from ratelimit import Priority, current_priority
+
+
+def _cache(clock, **kwargs) -> VerdictCache:
+    return VerdictCache(
+        maxsize=100,
+        positive_ttl=100,
+        negative_ttl=100,
+        error_ttl=10,
+        refresh_ahead=0.8,
+        stale_grace=50,
+        clock=clock,
+        **kwargs,
+    )
+
+
+async def test_refresh_runs_as_batch_without_the_request_deadline(clock):
+    cache = _cache(clock)
+    cache.set("example.com", True)
+    loads = []
+
+    async def loader(refresh: bool = False):
+        loads.append((refresh, current_priority(), remaining()))
+        return False, None
+
+    clock.now = 81
+    with deadline(0.5):
+        assert await cache.get_or_load("example.com", loader) is True
+        await asyncio.sleep(0)
+
+    assert loads == [(True, Priority.BATCH, math.inf)]
+    assert cache.get("example.com") is False
+    assert current_priority() == Priority.INTERACTIVE
+
+
+def test_sketch_counts_saturate_and_age():
+    sketch = FrequencySketch(64)
+    for _ in range(20):
+        sketch.increment("popular")
+    sketch.increment("rare")
+
+    assert sketch.frequency("popular") == 15
+    assert sketch.frequency("rare") >= 1
+    assert sketch.frequency("unseen") <= 1
+
+    # 10 * width increments halve every counter
+    for index in range(640):
+        sketch.increment(f"filler-{index}")
+    assert sketch.frequency("popular") <= 8
+
+
+def test_lru_evicts_least_recently_used():
+    policy = LRUPolicy(2)
+    policy.set("a", 1)
+    policy.set("b", 2)
+    policy.get("a")
+    policy.set("c", 3)
+
+    assert policy.peek("a") == 1
+    assert policy.peek("b") is None
+    assert len(policy) == 2
+
+
+def _survivors(policy, popular: list[str]) -> int:
+    for _ in range(5):
+        for key in popular:
+            if policy.get(key) is None:
+                policy.set(key, True)
+
+    for index in range(10000):
+        key = f"one-off-{index}"
+        if policy.get(key) is None:
+            policy.set(key, True)
+
+    assert len(policy) <= 100
+    return sum(policy.peek(key) is not None for key in popular)
+
+
+def test_tinylfu_keeps_popular_keys_through_a_flood():
+    popular = [f"popular-{index}" for index in range(50)]
+
+    assert _survivors(LRUPolicy(100), popular) == 0
+    # The sketch is only as wide as the cache, collisions may cost a few
+    assert _survivors(TinyLFUPolicy(100), popular) >= 40
+
+
+def test_tinylfu_admits_keys_seen_more_often():
+    policy = TinyLFUPolicy(100)
+    for index in range(100):
+        policy.set(f"old-{index}", True)
+
+    for _ in range(5):
+        policy.get("rising")
+    policy.set("rising", True)
+    # Pushes "rising" out of the window into the main segment
+    policy.set("next", True)
+
+    assert policy.peek("rising") is True
+    assert len(policy) <= 100
+
+
+def test_tinylfu_promotes_probation_hits():
+    policy = TinyLFUPolicy(100)
+    for index in range(3):
+        policy.set(index, index)
+
+    assert policy._segments[0] is policy._probation
+    assert policy.get(0) == 0
+    assert policy._segments[0] is policy._protected
+
+
+def test_tinylfu_pop_and_clear():
+    policy = TinyLFUPolicy(10)
+    for index in range(10):
+        policy.set(index, index)
+
+    policy.pop(3)
+    policy.pop("missing")
+    assert policy.peek(3) is None
+    assert len(policy) == 9
+
+    policy.clear()
+    assert len(policy) == 0
+    assert policy.get(0) is None
+
+
+def test_verdict_cache_with_tinylfu_policy(clock):
+    cache = _cache(clock, policy="tinylfu")
+    cache.set("example.com", True)
+    cache.set("trash.com", False)
+
+    assert cache.get("example.com") is True
+    assert cache.get("trash.com") is False
+    clock.now = 101
+    assert cache.get("example.com") is not True
+
+
+async def test_refresh_errors_are_reported(clock):
+    errors = []
+    cache = _cache(
+        clock, on_refresh_error=lambda key, error: errors.append((key, error))
+    )
+    cache.set("example.com", True)
+    error = RuntimeError("upstream exploded")
+
+    async def loader(refresh: bool = False):
+        raise error
+
+    clock.now = 81
+    assert await cache.get_or_load("example.com", loader) is True
+    # The refresh, then its done callback
+    for _ in range(2):
+        await asyncio.sleep(0)
+
+    assert errors == [("example.com", error)]
+    assert cache.get("example.com") is True
@@ -0,0 +1,89 @@
+import pytest
+
+from canonical import SUBADDRESS_RULES, canonical_domain, canonicalize
+
+
+@pytest.mark.parametrize(
+    "domain, canonical",
+    [
+        ("Example.COM", "example.com"),
+        ("  example.com\t", "example.com"),
+        ("example.com.", "example.com"),
+        ("example.com..", "example.com"),
+        ("пример.рф", "xn--e1afmkfd.xn--p1ai"),
+        ("ПРИМЕР.РФ.", "xn--e1afmkfd.xn--p1ai"),
+        ("xn--e1afmkfd.xn--p1ai", "xn--e1afmkfd.xn--p1ai"),
+        ("", ""),
+    ],
+)
+def test_canonical_domain(domain, canonical):
+    assert canonical_domain(domain) == canonical
+
+
+def test_domains_idna_rejects_are_kept_as_is():
+    # Labels longer than 63 characters can't be encoded
+    domain = "ü" * 70 + ".com"
+    assert canonical_domain(domain.upper()) == domain
+
+
+def test_folds_case_and_whitespace():
+    email = canonicalize("  John.Doe@Example.COM. ")
+
+    assert email.raw == "  John.Doe@Example.COM. "
+    assert email.local == "john.doe"
+    assert email.domain == "example.com"
+    assert email.address == "john.doe@example.com"
+
+
+def test_unicode_and_punycode_domains_are_the_same():
+    assert (
+        canonicalize("user@Пример.рф").address
+        == canonicalize("user@xn--e1afmkfd.xn--p1ai").address
+        == "user@xn--e1afmkfd.xn--p1ai"
+    )
+
+
+@pytest.mark.parametrize(
+    "email, stripped",
+    [
+        ("J.O.H.N+news@gmail.com", "john@gmail.com"),
+        ("j.o.h.n@googlemail.com", "john@googlemail.com"),
+        ("j.o+news@outlook.com", "j.o@outlook.com"),
+        ("john+news@proton.me", "john@proton.me"),
+        # Not a provider known to ignore subaddresses
+        ("j.o+news@example.com", "j.o+news@example.com"),
+        # Nothing left once stripped, the local part is kept
+        ("+news@gmail.com", "+news@gmail.com"),
+        ("...@gmail.com", "...@gmail.com"),
+    ],
+)
+def test_subaddress_rules(email, stripped):
+    assert canonicalize(email, strip_subaddress=True).address == stripped
+    assert canonicalize(email).address == email.lower()
+
+
+def test_subaddress_rules_use_canonical_domains():
+    assert all(domain == canonical_domain(domain) for domain in SUBADDRESS_RULES)
+    assert canonicalize("john+news@GMAIL.com.", strip_subaddress=True).address == (
+        "john@gmail.com"
+    )
+
+
+@pytest.mark.parametrize("email", [None, 42, b"a@example.com", ["a@example.com"]])
+def test_non_strings(email):
+    assert canonicalize(email) is None
+
+
+@pytest.mark.parametrize("email", ["", "not an email", "a@b@example.com", "a@@b"])
+def test_not_exactly_one_at(email):
+    assert canonicalize(email) is None
+
+
+@pytest.mark.parametrize(
+    "email, local, domain",
+    [("@example.com", "", "example.com"), ("a@", "a", ""), ("a@ .", "a", "")],
+)
+def test_empty_parts_are_left_to_the_syntax_stage(email, local, domain):
+    canonical = canonicalize(email)
+
+    assert (canonical.local, canonical.domain) == (local, domain)
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from hedging import Hedger
+
+
+def _hedger(delay: float | None = None, **kwargs) -> Hedger:
+    kwargs = {
+        "percentile": 50,
+        "budget_percent": 100,
+        "min_delay": 0.001,
+        "window": 20,
+        **kwargs,
+    }
+    hedger = Hedger(**kwargs)
+    # A threshold of its own, too few samples to replace it
+    if delay is not None:
+        hedger._delay = delay
+        hedger.min_samples = 1000
+    return hedger
+
+
+def _requests(*behaviours):
+    # One behaviour per attempt: a delay before answering, or an exception
+    attempts = []
+
+    async def request():
+        index = len(attempts)
+        attempts.append("started")
+        behaviour = behaviours[index]
+        try:
+            if isinstance(behaviour, Exception):
+                await asyncio.sleep(0.01)
+                raise behaviour
+            await asyncio.sleep(behaviour)
+        except asyncio.CancelledError:
+            attempts[index] = "cancelled"
+            raise
+        attempts[index] = "answered"
+        return index
+
+    return request, attempts
+
+
+async def test_delay_follows_the_latency_percentile():
+    hedger = _hedger(min_samples=20)
+    for _ in range(19):
+        request, _ = _requests(0.005)
+        await hedger.run(request)
+    assert hedger.delay() is None
+
+    request, _ = _requests(0.005)
+    await hedger.run(request)
+    assert 0.005 <= hedger.delay() < 0.05
+
+
+async def test_delay_never_goes_below_min_delay():
+    hedger = _hedger(min_samples=4, min_delay=0.5)
+    for _ in range(4):
+        request, _ = _requests(0)
+        await hedger.run(request)
+
+    assert hedger.delay() == 0.5
+
+
+async def test_hedge_wins_and_the_losing_request_is_cancelled():
+    won = []
+    hedger = _hedger(delay=0.01, on_won=lambda: won.append(True))
+    request, attempts = _requests(10, 0)
+
+    assert await hedger.run(request) == 1
+    await asyncio.sleep(0)
+    assert attempts == ["cancelled", "answered"]
+    assert won == [True]
+
+
+async def test_hedged_requests_are_timed_from_the_first_request():
+    # Slow requests cut short by a hedge still count as slow
+    hedger = _hedger(delay=0.05)
+    request, _ = _requests(10, 0)
+    await hedger.run(request)
+
+    assert hedger._latencies[-1] >= 0.05
+
+
+async def test_requests_given_up_on_are_recorded_and_cancelled():
+    hedger = _hedger(delay=0.01)
+    request, attempts = _requests(10, 10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(hedger.run(request), 0.05)
+    await asyncio.sleep(0)
+
+    assert attempts == ["cancelled", "cancelled"]
+    assert hedger._latencies[-1] >= 0.05
+
+
+async def test_budget_caps_hedges():
+    fired = []
+    hedger = _hedger(
+        delay=0.001, budget_percent=20, on_fired=lambda: fired.append(True)
+    )
+    for _ in range(20):
+        request, _ = _requests(0.005, 0.005)
+        await hedger.run(request)
+
+    assert 3 <= len(fired) <= 4
+
+
+async def test_admit_can_refuse_hedges():
+    hedger = _hedger(delay=0.001, admit=lambda: False)
+    request, attempts = _requests(0.01, 0)
+
+    assert await hedger.run(request) == 0
+    assert attempts == ["answered"]
+
+
+async def test_errors_before_the_delay_propagate():
+    hedger = _hedger(delay=1)
+    request, attempts = _requests(ValueError("primary"))
+
+    with pytest.raises(ValueError, match="primary"):
+        await hedger.run(request)
+    assert attempts == ["started"]
+
+
+async def test_failed_hedge_waits_for_the_first_request():
+    hedger = _hedger(delay=0.001)
+    request, _ = _requests(0.05, ValueError("hedge"))
+
+    assert await hedger.run(request) == 0
+
+
+async def test_first_error_wins_when_both_fail():
+    hedger = _hedger(delay=0.001)
+    request, _ = _requests(ValueError("primary"), ValueError("hedge"))
+
+    with pytest.raises(ValueError, match="primary"):
+        await hedger.run(request)
@@ -0,0 +1,24 @@
+import fastapi
+import pytest
+
+import main
+
+
+def _request(budget_ms: str | None = None) -> fastapi.Request:
+    headers = []
+    if budget_ms is not None:
+        headers.append(
+            (main.conf.VALIDATION_BUDGET_HEADER.lower().encode(), budget_ms.encode())
+        )
+    return fastapi.Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "budget_ms", [None, "", "soon", "0", "-5", "inf", "nan", "1e12"]
+)
+def test_budget_defaults_or_caps(budget_ms):
+    assert main._get_budget(_request(budget_ms)) == main.conf.VALIDATION_BUDGET
+
+
+def test_budget_can_be_shortened():
+    assert main._get_budget(_request("120")) == pytest.approx(0.12)
@@ -0,0 +1,68 @@
+import packed_domains
+from blocklist import DomainSuffixIndex
+from packed_domains import PackedDomainSet, build, is_packed_file, read_domains_file
+
+
+def test_read_domains_file(tmp_path):
+    path = tmp_path / "domains.txt"
+    path.write_text("# version: 2024-01\n\n Trash.COM.\n# comment\nспам.рф\n")
+
+    domains, version = read_domains_file(str(path))
+
+    assert domains == ["trash.com", "xn--80ayhh.xn--p1ai"]
+    assert version == "2024-01"
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "domains.bin")
+    domains = [f"domain{index}.com" for index in range(1000)]
+    build(domains + ["domain0.com", ""], path, version="v1")
+
+    packed = PackedDomainSet(path)
+
+    assert is_packed_file(path)
+    assert packed.version == "v1"
+    assert len(packed) == 1000
+    assert sorted(packed) == sorted(domains)
+    assert all(domain in packed for domain in domains)
+    assert "domain1000.com" not in packed
+    assert "" not in packed
+
+
+def test_empty_file(tmp_path):
+    path = str(tmp_path / "domains.bin")
+    build([], path)
+
+    packed = PackedDomainSet(path)
+
+    assert len(packed) == 0
+    assert list(packed) == []
+    assert "example.com" not in packed
+
+
+def test_hash_collisions_are_confirmed_on_the_domain(tmp_path, monkeypatch):
+    # Every domain shares one hash, only the byte comparison tells them apart
+    monkeypatch.setattr(packed_domains, "_hash", lambda key: 42)
+    path = str(tmp_path / "domains.bin")
+    build(["a.com", "b.com", "c.com"], path)
+
+    packed = PackedDomainSet(path)
+
+    assert all(domain in packed for domain in ("a.com", "b.com", "c.com"))
+    assert "d.com" not in packed
+
+
+def test_suffix_index_over_a_packed_set(tmp_path):
+    path = tmp_path / "domains.txt"
+    path.write_text("# version: 7\ntrash.com\n163.com\n")
+    packed_path = str(tmp_path / "domains.bin")
+    domains, version = read_domains_file(str(path))
+    build(domains, packed_path, version=version)
+
+    index = DomainSuffixIndex.from_file(packed_path)
+
+    assert index.version == "7"
+    assert index.match("mail.163.com") == "163.com"
+    assert index.match("trash.com") == "trash.com"
+    assert index.match("example.com") is None
+    assert index.match("com") is None
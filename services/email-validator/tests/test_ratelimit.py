@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import pytest
+
+from ratelimit import (
+    Priority,
+    RateLimitExceeded,
+    TokenBucket,
+    current_priority,
+    priority,
+)
+
+
+def test_burst_then_empty():
+    bucket = TokenBucket(rate=1, burst=3)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+async def test_refills_at_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+    assert bucket.try_acquire()
+
+    started_at = time.monotonic()
+    await bucket.acquire(timeout=1)
+    assert 0.01 < time.monotonic() - started_at < 0.2
+
+
+async def test_interactive_waiters_go_first():
+    bucket = TokenBucket(rate=50, burst=1)
+    assert bucket.try_acquire()
+    served = []
+
+    async def acquire(name: str, value: Priority):
+        await bucket.acquire(timeout=1, value=value)
+        served.append(name)
+
+    batch = [
+        asyncio.create_task(acquire(f"batch-{index}", Priority.BATCH))
+        for index in range(2)
+    ]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(acquire("interactive", Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+    assert bucket.queue_depth(Priority.BATCH) == 2
+    assert bucket.queue_depth(Priority.INTERACTIVE) == 1
+
+    await asyncio.gather(*batch, interactive)
+    assert served == ["interactive", "batch-0", "batch-1"]
+    assert bucket.queue_depth(Priority.BATCH) == 0
+
+
+async def test_rejects_right_away_when_wait_exceeds_timeout():
+    rejected = []
+    bucket = TokenBucket(rate=1, burst=1, on_rejected=rejected.append)
+    assert bucket.try_acquire()
+
+    started_at = time.monotonic()
+    with pytest.raises(RateLimitExceeded):
+        await bucket.acquire(timeout=0.1, value=Priority.BATCH)
+    assert time.monotonic() - started_at < 0.05
+    assert rejected == [Priority.BATCH]
+
+
+async def test_cancelled_waiter_does_not_take_a_token():
+    acquired = []
+    bucket = TokenBucket(
+        rate=50, burst=1, on_acquired=lambda value, wait: acquired.append(value)
+    )
+    assert bucket.try_acquire()
+
+    cancelled = asyncio.create_task(bucket.acquire(timeout=1, value=Priority.BATCH))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await bucket.acquire(timeout=1, value=Priority.INTERACTIVE)
+
+    assert acquired == [Priority.INTERACTIVE]
+    assert not bucket._waiters
+
+
+async def test_queued_callers_keep_refilled_tokens():
+    now = [0.0]
+    bucket = TokenBucket(rate=1, burst=1, clock=lambda: now[0])
+    assert bucket.try_acquire()
+    waiter = asyncio.create_task(bucket.acquire(timeout=10))
+    await asyncio.sleep(0)
+
+    # A token refilled, but it belongs to the queued caller
+    now[0] = 1.0
+    assert not bucket.try_acquire()
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+
+async def test_priority_is_inherited_by_tasks():
+    async def read():
+        return current_priority()
+
+    assert current_priority() == Priority.INTERACTIVE
+    with priority(Priority.BATCH):
+        task = asyncio.create_task(read())
+    assert await task == Priority.BATCH
+    assert current_priority() == Priority.INTERACTIVE
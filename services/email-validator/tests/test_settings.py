@@ -0,0 +1,18 @@
+import pydantic
+import pytest
+
+from settings import AppConfig
+
+
+def test_slow_call_duration_must_be_below_the_budget():
+    with pytest.raises(pydantic.ValidationError):
+        AppConfig(VALIDATION_BUDGET=0.5, CIRCUIT_BREAKER_SLOW_CALL_DURATION=1.0)
+
+
+def test_slow_call_duration_is_free_without_breaker():
+    config = AppConfig(
+        CIRCUIT_BREAKER_ENABLED=False,
+        VALIDATION_BUDGET=0.5,
+        CIRCUIT_BREAKER_SLOW_CALL_DURATION=1.0,
+    )
+    assert config.CIRCUIT_BREAKER_SLOW_CALL_DURATION == 1.0
@@ -0,0 +1,180 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from cache import MISSING
+from shared_cache import SharedVerdictCache
+
+
+class _CountingRedis(fakeredis.FakeAsyncRedis):
+    pipelines = 0
+
+    def pipeline(self, *args, **kwargs):
+        self.pipelines += 1
+        return super().pipeline(*args, **kwargs)
+
+
+class _HangingPipeline:
+    def __init__(self):
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    def get(self, key):
+        self.commands.append(("get", key))
+
+    def pttl(self, key):
+        self.commands.append(("pttl", key))
+
+    async def execute(self):
+        await asyncio.sleep(60)
+
+
+class _HangingRedis:
+    def pipeline(self, transaction: bool = True):
+        return _HangingPipeline()
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def client(server):
+    return _CountingRedis(server=server)
+
+
+def _shared_cache(client, timeout: float = 0.5, retry_after: float = 60.0):
+    return SharedVerdictCache(
+        client, prefix="test:", timeout=timeout, retry_after=retry_after
+    )
+
+
+async def _flush(shared_cache: SharedVerdictCache):
+    await asyncio.gather(*shared_cache._tasks)
+
+
+async def test_put_then_get(client):
+    shared_cache = _shared_cache(client)
+    shared_cache.put("example.com", True, 60)
+    shared_cache.put("trash.com", False, 120)
+    await _flush(shared_cache)
+
+    assert await client.get("test:example.com") == b"1"
+    assert await client.get("test:trash.com") == b"0"
+
+    verdict, ttl = await shared_cache.get("example.com")
+    assert verdict is True
+    assert 59 < ttl <= 60
+    verdict, ttl = await shared_cache.get("trash.com")
+    assert verdict is False
+    assert 119 < ttl <= 120
+
+
+async def test_missing_and_expired_keys_are_misses(client):
+    shared_cache = _shared_cache(client)
+    await client.set("test:stale.com", b"1")
+
+    assert await shared_cache.get("unknown.com") == (MISSING, 0.0)
+    # Keys without a TTL are never trusted
+    assert await shared_cache.get("stale.com") == (MISSING, 0.0)
+
+
+async def test_zero_ttl_is_not_written(client):
+    shared_cache = _shared_cache(client)
+    shared_cache.put("example.com", True, 0)
+    await _flush(shared_cache)
+
+    assert client.pipelines == 0
+    assert await client.get("test:example.com") is None
+
+
+async def test_reads_in_one_tick_share_a_pipeline(client):
+    shared_cache = _shared_cache(client)
+    for domain in ("a.com", "b.com"):
+        await client.set(f"test:{domain}", b"1", px=60000)
+
+    results = await asyncio.gather(
+        shared_cache.get("a.com"),
+        shared_cache.get("b.com"),
+        shared_cache.get("a.com"),
+        shared_cache.get("c.com"),
+    )
+
+    assert [verdict for verdict, _ in results] == [True, True, True, MISSING]
+    assert client.pipelines == 1
+
+
+async def test_writes_in_one_tick_share_a_pipeline(client):
+    shared_cache = _shared_cache(client)
+    shared_cache.put("a.com", True, 60)
+    shared_cache.put("b.com", False, 60)
+    shared_cache.put("a.com", False, 60)
+    await _flush(shared_cache)
+
+    assert client.pipelines == 1
+    assert await client.get("test:a.com") == b"0"
+    assert await client.get("test:b.com") == b"0"
+
+
+async def test_connection_failure_fails_open(server, client):
+    shared_cache = _shared_cache(client)
+    server.connected = False
+
+    assert await shared_cache.get("example.com") == (MISSING, 0.0)
+    assert not shared_cache.available
+
+
+async def test_skipped_until_retry_after(server, client):
+    shared_cache = _shared_cache(client, retry_after=0.1)
+    server.connected = False
+    await shared_cache.get("example.com")
+    pipelines = client.pipelines
+
+    server.connected = True
+    await client.set("test:example.com", b"1", px=60000)
+    # Neither reads nor writes reach Redis while the tier is skipped
+    assert await shared_cache.get("example.com") == (MISSING, 0.0)
+    shared_cache.put("other.com", True, 60)
+    await _flush(shared_cache)
+    assert client.pipelines == pipelines
+
+    await asyncio.sleep(0.15)
+    assert shared_cache.available
+    verdict, _ = await shared_cache.get("example.com")
+    assert verdict is True
+
+
+async def test_write_failure_skips_the_tier(server, client):
+    shared_cache = _shared_cache(client)
+    server.connected = False
+    shared_cache.put("example.com", True, 60)
+    await _flush(shared_cache)
+
+    assert not shared_cache.available
+
+
+async def test_slow_read_times_out_as_miss():
+    shared_cache = _shared_cache(_HangingRedis(), timeout=0.05)
+
+    started_at = asyncio.get_running_loop().time()
+    assert await shared_cache.get("example.com") == (MISSING, 0.0)
+    assert asyncio.get_running_loop().time() - started_at < 0.5
+    assert not shared_cache.available
+
+    for task in shared_cache._tasks:
+        task.cancel()
+
+
+async def test_close_waits_for_pending_writes(client):
+    shared_cache = _shared_cache(client)
+    shared_cache.put("example.com", True, 60)
+    await shared_cache.close()
+
+    assert await client.get("test:example.com") == b"1"
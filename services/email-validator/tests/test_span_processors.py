@@ -0,0 +1,17 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk", reason="needs requirements-tracing.txt")
+
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+from span_processors import DropCountingSpanProcessor  # noqa: E402
+
+
+@pytest.mark.parametrize("max_queue_size", [1, 100, 512, 2048])
+def test_drop_counting_processor_accepts_small_queues(max_queue_size):
+    processor = DropCountingSpanProcessor(
+        InMemorySpanExporter(), max_queue_size=max_queue_size
+    )
+    processor.shutdown()
@@ -0,0 +1,91 @@
+import itertools
+import random
+import re
+
+import pytest
+
+from syntax import email_regex, is_valid_syntax
+
+# Quirks of email_regex is_valid_syntax has to reproduce, decided by the regex
+REGRESSIONS = [
+    ("john.doe@example.com", True),
+    ("jane_doe+news@mail.example.co.uk", True),
+    ("ADMIN@EXAMPLE.ORG", True),
+    ("a+b@example.io", True),
+    ("1@2.ab", True),
+    ("a@sub.example.com", True),
+    # "[.-_+]" is the range "." to "_", "/", "@" and "^" are separators too
+    ("a/b@example.com", True),
+    ("a@b@example.com", True),
+    ("a^b@x.yz", True),
+    ("a-b@ex-ample.com", False),
+    ("a~b@example.com", False),
+    # "[A-Z|a-z]" allows "|" in top level labels
+    ("a@example.c|m", True),
+    ("a@-.com", True),
+    ("a..b@example.com", False),
+    (".a@example.com", False),
+    ("a.@example.com", False),
+    ("a@example.c", False),
+    ("a@example.c0m", False),
+    ("a@example..com", False),
+    ("a@example.com.", False),
+    ("a@example", False),
+    ("o'brien@corp.com", False),
+    ("john@eu.my-company.com", False),
+    ("jöhn@example.com", False),
+    ("a@exämple.com", False),
+    ("a@b.com ", False),
+    (" a@b.com", False),
+    ("", False),
+    ("@", False),
+    ("a@", False),
+    ("@example.com", False),
+]
+
+_ALPHABET = "aZ09" + "./:;<=>?@[\\]^_+-|" + " \t\né"
+_TYPICAL = [email for email, valid in REGRESSIONS if valid]
+
+
+def _regex_is_valid(email: str) -> bool:
+    return bool(re.fullmatch(email_regex, email))
+
+
+@pytest.mark.parametrize("email, valid", REGRESSIONS)
+def test_regressions(email, valid):
+    assert _regex_is_valid(email) is valid
+    assert is_valid_syntax(email) is valid
+
+
+def test_matches_the_regex_on_every_short_address():
+    # Every local part and top level label of up to 2 characters from the
+    # characters the regex treats differently
+    chars = "a0.-_+@|/é~"
+    parts = [
+        "".join(part)
+        for size in range(3)
+        for part in itertools.product(chars, repeat=size)
+    ]
+    for local, label in itertools.product(parts, repeat=2):
+        for email in (f"{local}@example.{label}", f"{local}@{label}.com"):
+            assert is_valid_syntax(email) == _regex_is_valid(email), email
+
+
+def test_matches_the_regex_on_random_input():
+    rng = random.Random(0)
+    for _ in range(20000):
+        if rng.random() < 0.5:
+            email = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 16)))
+        else:
+            # Mutate a valid address, most random strings have no "@" at all
+            email = list(rng.choice(_TYPICAL))
+            for _ in range(rng.randint(1, 3)):
+                email[rng.randrange(len(email))] = rng.choice(_ALPHABET)
+            email = "".join(email)
+
+        assert is_valid_syntax(email) == _regex_is_valid(email), email
+
+
+def test_linear_on_crafted_local_parts():
+    # Makes the regex backtrack exponentially
+    assert not is_valid_syntax("1" * 100_000 + "!@example.com")
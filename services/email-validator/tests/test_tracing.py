@@ -0,0 +1,30 @@
+import types
+
+import httpx
+import pytest
+
+pytest.importorskip("opentelemetry.sdk", reason="needs requirements-tracing.txt")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+
+from tracing import _redact_httpx_url  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://verifymail.io/api/john@example.com?key=secret",
+        "https://verifymail.io/api/john%40example.com?key=secret",
+    ],
+)
+async def test_httpx_urls_hide_the_email_and_api_key(url):
+    tracer = TracerProvider().get_tracer(__name__)
+    request = types.SimpleNamespace(url=httpx.URL(url))
+
+    with tracer.start_as_current_span(
+        "GET", attributes={"http.url": url, "url.full": url}
+    ) as span:
+        await _redact_httpx_url(span, request)
+
+    assert span.attributes["http.url"] == "https://verifymail.io/api/{email}"
+    assert span.attributes["url.full"] == "https://verifymail.io/api/{email}"
@@ -0,0 +1,342 @@
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+import validator
+from breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from cache import VerdictCache
+from deadline import DeadlineExceeded, deadline
+from hedging import Hedger
+from http_client import close_http_client
+
+
+async def _lines(emails: list[str]):
+    for line, email in enumerate(emails, 1):
+        yield line, email
+
+
+async def _settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_stream_yields_every_line():
+    emails = ["not an email", "a@@b.com", "@example.com"]
+    results = [
+        result async for result in validator.validate_email_stream(_lines(emails))
+    ]
+
+    assert sorted(results) == [
+        (1, "not an email", False),
+        (2, "a@@b.com", False),
+        (3, "@example.com", False),
+    ]
+
+
+async def test_stream_closed_with_full_queue_leaves_no_tasks():
+    emails = ["not an email"] * (validator.conf.STREAM_MAX_IN_FLIGHT * 3)
+    stream = validator.validate_email_stream(_lines(emails))
+    assert await anext(stream) == (1, "not an email", False)
+    await _settle()
+
+    await stream.aclose()
+    await _settle()
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.fixture
+async def hung_upstream(monkeypatch):
+    # Accepts connections and never answers
+    writers = []
+    server = await asyncio.start_server(
+        lambda reader, writer: writers.append(writer), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    monkeypatch.setattr(
+        validator.conf, "VERIFY_MAIL_URL", f"http://127.0.0.1:{port}/{{email}}"
+    )
+    yield
+    await close_http_client()
+    for writer in writers:
+        writer.close()
+    server.close()
+
+
+async def test_calls_cut_by_the_deadline_trip_the_breaker(hung_upstream, monkeypatch):
+    breaker = CircuitBreaker(
+        window=30,
+        min_calls=3,
+        error_rate=0.5,
+        slow_call_duration=0.05,
+        slow_call_rate=0.8,
+        open_duration=60,
+        half_open_calls=1,
+    )
+    monkeypatch.setattr(validator, "verify_mail_breaker", breaker)
+
+    for _ in range(2):
+        with deadline(0.1), pytest.raises(DeadlineExceeded):
+            await validator._request_verify_mail("a@example.com")
+    # Cancelled by the caller's own timeout rather than the deadline
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(validator._request_verify_mail("a@example.com"), 0.1)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        await validator._request_verify_mail("a@example.com")
+
+
+async def test_calls_cut_before_the_slow_duration_are_not_counted(
+    hung_upstream, monkeypatch
+):
+    breaker = CircuitBreaker(
+        window=30,
+        min_calls=1,
+        error_rate=0.5,
+        slow_call_duration=1.0,
+        slow_call_rate=0.5,
+        open_duration=60,
+        half_open_calls=1,
+    )
+    monkeypatch.setattr(validator, "verify_mail_breaker", breaker)
+
+    with deadline(0.05), pytest.raises(DeadlineExceeded):
+        await validator._request_verify_mail("a@example.com")
+
+    assert breaker.state == CircuitState.CLOSED
+    assert not breaker._outcomes
+
+
+async def test_hedges_only_get_what_is_left_of_the_deadline(monkeypatch):
+    hedger = Hedger(percentile=95, budget_percent=100, min_delay=0.05, window=20)
+    hedger._delay = 0.05
+    monkeypatch.setattr(validator, "verify_mail_hedger", hedger)
+    monkeypatch.setattr(validator, "verify_mail_breaker", None)
+    monkeypatch.setattr(validator, "verify_mail_limiter", None)
+    timeouts = []
+
+    class Client:
+        async def get(self, url: str, timeout: float):
+            timeouts.append(timeout)
+            await asyncio.sleep(timeout)
+            raise httpx.ReadTimeout("")
+
+    monkeypatch.setattr(validator, "get_http_client", Client)
+
+    with deadline(0.2), pytest.raises(DeadlineExceeded):
+        await validator._request_verify_mail("a@example.com")
+
+    assert len(timeouts) == 2
+    assert timeouts[0] <= 0.2
+    assert timeouts[1] <= timeouts[0] - 0.05
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+
+    async def request_verify_mail(email: str) -> bool | None:
+        calls.append(email)
+        return True
+
+    monkeypatch.setattr(validator, "_request_verify_mail", request_verify_mail)
+    validator.verdict_cache.clear()
+    yield calls
+    validator.verdict_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "email",
+    [
+        "john@eu.my-company.com",
+        "x@cs.uni-berlin.de",
+        "a@mail.web3.io",
+        "o'brien@corp.com",
+        "user@пример.рф",
+    ],
+)
+async def test_upstream_decides_addresses_the_legacy_syntax_rejects(upstream, email):
+    validation = await validator.validation_pipeline.run(
+        validator.start_validation(email)
+    )
+
+    assert validation.valid is True
+    assert validation.decided_by == "upstream"
+    assert len(upstream) == 1
+
+
+@pytest.mark.parametrize(
+    "email", ["not an email", "a@b@c.com", "@example.com", "a@localhost", "a@b..com"]
+)
+async def test_malformed_addresses_never_reach_upstream(upstream, email):
+    validation = await validator.validation_pipeline.run(
+        validator.start_validation(email)
+    )
+
+    assert validation.valid is False
+    assert validation.decided_by in ("parse", "syntax")
+    assert upstream == []
+
+
+@pytest.mark.parametrize(
+    "email, valid", [("john@example.com", True), ("o'brien@corp.com", False)]
+)
+async def test_out_of_budget_falls_back_to_the_legacy_syntax(email, valid):
+    validation = await validator.run_validation(
+        validator.start_validation(email), local=True
+    )
+
+    assert validation.valid is valid
+    assert validation.decided_by == "fallback"
+
+
+async def test_batch_calls_upstream_once_per_domain(monkeypatch):
+    # Too small to answer the repeated domains, they must not depend on it
+    monkeypatch.setattr(
+        validator,
+        "verdict_cache",
+        VerdictCache(
+            maxsize=20,
+            positive_ttl=60,
+            negative_ttl=60,
+            error_ttl=10,
+            policy="tinylfu",
+        ),
+    )
+    calls = []
+    in_flight = peak = 0
+
+    async def request_verify_mail(email: str) -> bool | None:
+        nonlocal in_flight, peak
+        calls.append(email)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return not email.endswith("0.com")
+
+    monkeypatch.setattr(validator, "_request_verify_mail", request_verify_mail)
+
+    emails = [
+        f"user{index}@domain{domain}.com" for index in range(5) for domain in range(150)
+    ]
+    verdicts = await validator.validate_emails(emails)
+
+    assert len(calls) == 150
+    assert peak <= validator.conf.BATCH_UPSTREAM_CONCURRENCY
+    assert verdicts == [not email.endswith("0.com") for email in emails]
+
+
+async def test_batch_falls_back_per_address(monkeypatch):
+    async def request_verify_mail(email: str) -> bool | None:
+        return None
+
+    monkeypatch.setattr(validator, "_request_verify_mail", request_verify_mail)
+    validator.verdict_cache.clear()
+
+    verdicts = await validator.validate_emails(
+        ["john@unanswered.com", "o'brien@unanswered.com"]
+    )
+
+    assert verdicts == [True, False]
+
+
+def _stage_results() -> dict[tuple[str, str], float]:
+    return {
+        (stage, result): REGISTRY.get_sample_value(
+            "email_validator_validation_stage_results_total",
+            {"stage": stage, "result": result},
+        )
+        or 0
+        for stage in ("syntax", "blocklist", "cache")
+        for result in ("pass", "valid", "invalid")
+    }
+
+
+async def test_batch_runs_domain_stages_once_per_domain(upstream, monkeypatch):
+    lookups = []
+
+    class Blocklist:
+        def match(self, domain: str) -> str | None:
+            lookups.append(domain)
+            return domain if domain == "banned.com" else None
+
+    monkeypatch.setattr(validator, "banned_domains", Blocklist())
+    hits_before = REGISTRY.get_sample_value("email_validator_banned_domain_hits_total")
+    results_before = _stage_results()
+
+    emails = [
+        f"user{index}@{domain}"
+        for index in range(4)
+        for domain in ("banned.com", "example.com", "example.org")
+    ] + ["user@example..com"]
+    verdicts = await validator.validate_emails(emails)
+
+    assert verdicts == [not email.endswith("banned.com") for email in emails[:-1]] + [
+        False
+    ]
+    assert sorted(lookups) == ["banned.com", "example.com", "example.org"]
+    assert len(upstream) == 2
+    assert (
+        REGISTRY.get_sample_value("email_validator_banned_domain_hits_total")
+        - hits_before
+        == 1
+    )
+    results = _stage_results()
+    increments = {
+        key: results[key] - results_before[key]
+        for key in results
+        if results[key] != results_before[key]
+    }
+    assert increments == {
+        ("syntax", "pass"): 12,
+        ("syntax", "invalid"): 1,
+        ("blocklist", "invalid"): 1,
+        ("blocklist", "pass"): 2,
+        ("cache", "pass"): 2,
+    }
+
+
+async def test_cache_hits_past_refresh_ahead_refresh_once(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        validator,
+        "verdict_cache",
+        VerdictCache(
+            maxsize=100,
+            positive_ttl=100,
+            negative_ttl=100,
+            error_ttl=10,
+            refresh_ahead=0.8,
+            clock=lambda: now[0],
+        ),
+    )
+    calls = []
+
+    async def request_verify_mail(email: str) -> bool | None:
+        calls.append(email)
+        return True
+
+    monkeypatch.setattr(validator, "_request_verify_mail", request_verify_mail)
+    validator.verdict_cache.set("refreshed.com", True)
+
+    async def validate(email: str):
+        return await validator.validation_pipeline.run(
+            validator.start_validation(email)
+        )
+
+    now[0] = 50
+    assert (await validate("a@refreshed.com")).decided_by == "cache"
+
+    now[0] = 81
+    for _ in range(5):
+        validation = await validate("a@refreshed.com")
+        assert validation.valid is True
+    await _settle()
+
+    assert calls == ["a@refreshed.com"]
+    now[0] = 150
+    assert (await validate("a@refreshed.com")).decided_by == "cache"
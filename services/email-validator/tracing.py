@@ -1,108 +1,142 @@
-import sys
+import functools
+import inspect
 
 import fastapi
-from opentelemetry import metrics
-from opentelemetry import trace as _trace
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
-from opentelemetry.instrumentation.system_metrics import SystemMetricsInstrumentor
-from opentelemetry.instrumentation.urllib import URLLibInstrumentor
-from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from logger import get_logger
 from settings import conf
 
+# Only the API is needed for spans in the code, the SDK, exporter and
+# instrumentations are imported by init_tracing. With tracing disabled
+# OpenTelemetry isn't imported at all and need not be installed.
+if conf.TRACING_ENABLED:
+    from opentelemetry import trace as _trace
+else:
+    _trace = None
+
 logger = get_logger(__name__, level=conf.LOG_LEVEL)
 
 
-def _get_trace_provider(service_name: str) -> TracerProvider:
+def _get_propagator():
+    from opentelemetry.trace.propagation.tracecontext import (
+        TraceContextTextMapPropagator,
+    )
+
+    return TraceContextTextMapPropagator()
+
+
+_propagator = _get_propagator() if _trace is not None else None
+
+
+def _get_trace_provider(service_name: str):
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    from span_processors import DropCountingSpanProcessor, TailSamplingSpanProcessor
+
     assert conf.OTEL_EXPORTER_OTLP_ENDPOINT, "OTEL_EXPORTER_OTLP_ENDPOINT is not set"
 
+    span_processor = DropCountingSpanProcessor(
+        OTLPSpanExporter(endpoint=conf.OTEL_EXPORTER_OTLP_ENDPOINT),
+        max_queue_size=conf.TRACING_EXPORT_QUEUE_SIZE,
+    )
+    if conf.TRACING_TAIL_SAMPLING:
+        span_processor = TailSamplingSpanProcessor(
+            span_processor,
+            slow_threshold=conf.TRACING_TAIL_SLOW_THRESHOLD,
+            keep_ratio=conf.TRACING_TAIL_KEEP_RATIO,
+        )
+
     tracer_provider = TracerProvider(
         resource=Resource.create({SERVICE_NAME: service_name}),
-        active_span_processor=BatchSpanProcessor(
-            OTLPSpanExporter(endpoint=conf.OTEL_EXPORTER_OTLP_ENDPOINT)
-        ),
+        sampler=ParentBased(TraceIdRatioBased(conf.TRACING_SAMPLE_RATIO)),
     )
+    tracer_provider.add_span_processor(span_processor)
     _trace.set_tracer_provider(tracer_provider)
 
     return tracer_provider
 
 
-def get_meter_provider(service_name: str):
-    resource = Resource(attributes={SERVICE_NAME: service_name})
+def _instrument_fastapi(fastapi_app):
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
-    reader = PeriodicExportingMetricReader(
-        OTLPMetricExporter(conf.OTEL_EXPORTER_OTLP_ENDPOINT)
-    )
-    provider = MeterProvider(resource=resource, metric_readers=[reader])
-    metrics.set_meter_provider(provider)
+    return FastAPIInstrumentor().instrument_app(fastapi_app)
 
-    return provider
 
+# URL attributes of the old and the stable HTTP semantic conventions
+_URL_ATTRIBUTES = ("http.url", "url.full")
 
-def _get_propagator():
-    return TraceContextTextMapPropagator()
 
+async def _redact_httpx_url(span, request):
+    # The Verify Mail API key is passed in the query string and the email
+    # address in the path, which is reported as its URL template instead
+    if span.is_recording():
+        url = request.url
+        path = "/".join(
+            "{email}" if "@" in segment else segment for segment in url.path.split("/")
+        )
+        redacted = f"{url.scheme}://{url.netloc.decode()}{path}"
+        for name in _URL_ATTRIBUTES:
+            if name in span.attributes:
+                span.set_attribute(name, redacted)
 
-_system_metrics_config = {
-    "system.cpu.time": ["idle", "user", "system", "irq"],
-    "system.cpu.utilization": ["idle", "user", "system", "irq"],
-    "system.memory.usage": ["used", "free", "cached"],
-    "system.memory.utilization": ["used", "free", "cached"],
-    "system.swap.usage": ["used", "free"],
-    "system.swap.utilization": ["used", "free"],
-    "system.disk.io": ["read", "write"],
-    "system.disk.operations": ["read", "write"],
-    "system.disk.time": ["read", "write"],
-    "system.network.dropped.packets": ["transmit", "receive"],
-    "system.network.packets": ["transmit", "receive"],
-    "system.network.errors": ["transmit", "receive"],
-    "system.network.io": ["transmit", "receive"],
-    "system.network.connections": ["family", "type"],
-    "system.thread_count": None,
-    "process.runtime.memory": ["rss", "vms"],
-    "process.runtime.cpu.time": ["user", "system"],
-}
 
+def _instrument_httpx():
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 
-def _instrument_fastapi(fastapi_app):
-    return FastAPIInstrumentor().instrument_app(fastapi_app)
+    # Patches clients created from now on, init_tracing runs before the
+    # Verify Mail client is built on startup
+    return HTTPXClientInstrumentor().instrument(async_request_hook=_redact_httpx_url)
 
 
-def _instrument_asgi(asgi_app):
-    return OpenTelemetryMiddleware(asgi_app)
+def trace(span_name: str, trace_name: str = None):
+    # The tracer is a proxy until init_tracing sets the provider. For
+    # coroutine functions the span wraps the awaited body, not the call
+    # that merely creates the coroutine.
+    def decorator(func):
+        if _trace is None:
+            return func
 
+        tracer = _trace.get_tracer(trace_name or __name__)
+        if inspect.iscoroutinefunction(func):
 
-def trace(span_name: str, trace_name: str = None):
-    return (
-        _trace.get_tracer_provider()
-        .get_tracer(trace_name or __name__)
-        .start_as_current_span(span_name)
-    )
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.start_as_current_span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def set_span_attribute(key: str, value):
+    if _trace is not None:
+        _trace.get_current_span().set_attribute(key, value)
+
+
+def get_remote_span(traceparent: str | None):
+    # The caller's span from a traceparent header, None with tracing off
+    if _trace is None:
+        return None
+    carrier = {"traceparent": traceparent} if traceparent else {}
+    return _trace.get_current_span(_propagator.extract(carrier))
 
 
 def init_tracing(fastapi_app: fastapi.FastAPI, service_name):
     _get_trace_provider(service_name)
     _instrument_fastapi(fastapi_app)
-    _instrument_asgi(fastapi_app)
-
-    @fastapi_app.middleware("http")
-    async def _propagate_traceparent(request: fastapi.Request, call_next):
-        traceparent = request.headers.get("traceparent")
-        carrier = {"traceparent": traceparent} if traceparent else {}
-        request.state.span = _trace.get_current_span(_get_propagator().extract(carrier))
-
-        return await call_next(request)
+    _instrument_httpx()
 
     return fastapi_app